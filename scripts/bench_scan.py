@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Measure process-tool latency against the number of scan workers.
+
+Usage: python scripts/bench_scan.py [--workers 1,2,4,8] [--mode thread|process]
+"""
+
+import argparse
+import statistics
+import time
+
+from mcp_memory.tools import processes
+
+TOOLS = {
+    "list_top_processes": lambda: processes.list_top_processes(n=100),
+    "list_process_groups": lambda: processes.list_process_groups(n=50),
+    "find_stale_processes": lambda: processes.find_stale_processes(min_age_hours=0),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma-separated counts")
+    parser.add_argument("--mode", default="thread", choices=["thread", "process"])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    processes.SCAN_MODE = args.mode
+    print(f"{len(processes.psutil.pids())} processes, mode={args.mode}")
+    print(f"{'workers':>7}  " + "  ".join(f"{name:>22}" for name in TOOLS))
+
+    for workers in (int(w) for w in args.workers.split(",")):
+        processes.SCAN_WORKERS = workers
+        cells = []
+        for tool in TOOLS.values():
+            tool()  # warm up the pool and psutil caches
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                tool()
+                times.append(time.perf_counter() - start)
+            cells.append(f"{statistics.median(times) * 1000:>19.1f} ms")
+        print(f"{workers:>7}  " + "  ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Measure inspect_process_memory on a synthetic smaps with many mappings.
+
+Usage: python scripts/bench_smaps.py [--mappings 100000]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from mcp_memory.tools import smaps
+
+# Field lines of one mapping as printed by Linux 6.x
+FIELDS = (
+    "Size", "KernelPageSize", "MMUPageSize", "Rss", "Pss", "Pss_Dirty",
+    "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty",
+    "Referenced", "Anonymous", "KSM", "LazyFree", "AnonHugePages",
+    "ShmemPmdMapped", "FilePmdMapped", "Shared_Hugetlb", "Private_Hugetlb",
+    "Swap", "SwapPss", "Locked",
+)
+PATHS = ("", "[heap]", "/usr/lib/libjvm.so", "/dev/shm/buf", "")
+
+
+def _smaps(mappings: int) -> str:
+    lines = []
+    for i in range(mappings):
+        start = 0x7F0000000000 + i * 0x1000
+        lines.append(
+            f"{start:x}-{start + 0x1000:x} rw-p 00000000 00:00 0 {PATHS[i % 5]}"
+        )
+        lines.extend(f"{name + ':':<16}{i % 4096:>8} kB" for name in FIELDS)
+        lines.append("THPeligible:    0")
+        lines.append("VmFlags: rd wr mr mw me ac sd")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mappings", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        (Path(root) / "1").mkdir()
+        (Path(root) / "1" / "smaps").write_text(_smaps(args.mappings))
+        smaps.PROC_ROOT = root
+
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            smaps.inspect_process_memory(1)
+            times.append(time.perf_counter() - start)
+
+    print(f"{args.mappings} mappings: {statistics.median(times) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Measure mcp-memory cold start: time to first response and import breakdown.
+
+Usage: python scripts/bench_startup.py [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+PROTOCOL_VERSION = "2025-06-18"
+REQUESTS = [
+    ("initialize", {
+        "protocolVersion": PROTOCOL_VERSION,
+        "capabilities": {},
+        "clientInfo": {"name": "bench-startup", "version": "0"},
+    }),
+    ("tools/list", {}),
+    ("tools/call", {"name": "list_memory_usage", "arguments": {}}),
+]
+
+
+def time_session(lazy: bool) -> list[float]:
+    """Spawn the stdio server and time each response from process start."""
+    env = dict(os.environ, MCP_MEMORY_LAZY="1" if lazy else "0")
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "mcp_memory"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        text=True,
+    )
+    timings = []
+    try:
+        for request_id, (method, params) in enumerate(REQUESTS, start=1):
+            message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+            proc.stdin.write(json.dumps(message | {"params": params}) + "\n")
+            proc.stdin.flush()
+            while json.loads(proc.stdout.readline()).get("id") != request_id:
+                pass
+            timings.append(time.perf_counter() - start)
+            if method == "initialize":
+                note = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+                proc.stdin.write(json.dumps(note) + "\n")
+                proc.stdin.flush()
+    finally:
+        proc.kill()
+        proc.wait()
+    return timings
+
+
+def import_breakdown(module: str) -> dict[str, float]:
+    """Self import time in seconds, summed per top-level package."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    totals: dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us = line.split("|")[0].split(":")[1]
+        name = line.split("|")[2].strip()
+        totals[name.split(".")[0]] += int(self_us) / 1e6
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Sessions per mode")
+    args = parser.parse_args()
+
+    print(f"{'mode':>6}  {'initialize':>12}  {'tools/list':>12}  {'first call':>12}")
+    for lazy in (False, True):
+        runs = [time_session(lazy) for _ in range(args.repeat)]
+        medians = [statistics.median(step) * 1000 for step in zip(*runs)]
+        cells = "  ".join(f"{m:>9.1f} ms" for m in medians)
+        print(f"{'lazy' if lazy else 'eager':>6}  {cells}")
+
+    for module in ("mcp_memory.server", "mcp_memory.lazy"):
+        print(f"\nimport {module}:")
+        totals = import_breakdown(module)
+        print(f"  {'total':<16} {sum(totals.values()) * 1000:>8.1f} ms")
+        for package, seconds in sorted(totals.items(), key=lambda kv: -kv[1])[:10]:
+            print(f"  {package:<16} {seconds * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,123 @@
 """Entry point for mcp-memory server."""
 
-from mcp_memory.server import mcp
+import argparse
+import os
 
+from mcp_memory.defaults import (
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_PEER_TIMEOUT,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_SNAPSHOT_TTL,
+)
 
-def main() -> None:
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(
+        prog="mcp-memory",
+        description="MCP server for memory management. Runs on stdio by default; "
+        "--transport http/sse or --socket run a shared daemon for many clients.",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http", "sse"],
+        default="stdio",
+        help="Transport to serve on (default: stdio)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP bind address")
+    parser.add_argument("--port", type=int, default=8765, help="HTTP port")
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Serve HTTP on a Unix socket instead of TCP",
+    )
+    parser.add_argument(
+        "--snapshot-ttl",
+        type=float,
+        default=DEFAULT_SNAPSHOT_TTL,
+        help="Daemon: max age in seconds of shared process snapshots "
+        f"(default: {DEFAULT_SNAPSHOT_TTL})",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=DEFAULT_RATE_LIMIT,
+        help="Daemon: requests per second per client, 0 to disable "
+        f"(default: {DEFAULT_RATE_LIMIT})",
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT,
+        help="Daemon: in-flight tool calls per client, 0 to disable "
+        f"(default: {DEFAULT_MAX_CONCURRENT})",
+    )
+    parser.add_argument(
+        "--allow-kill",
+        action="store_true",
+        help="Daemon: serve kill_processes; clients are not authenticated, so "
+        "anyone who can reach the daemon can signal processes as its user",
+    )
+    parser.add_argument(
+        "--peer",
+        action="append",
+        default=[],
+        metavar="[LABEL=]URL",
+        help="Aggregate over a peer mcp-memory server (repeatable; "
+        "also MCP_MEMORY_PEERS, comma-separated)",
+    )
+    parser.add_argument(
+        "--peer-timeout",
+        type=float,
+        default=DEFAULT_PEER_TIMEOUT,
+        help=f"Seconds to wait for each peer (default: {DEFAULT_PEER_TIMEOUT})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
     """Run the MCP memory server."""
-    mcp.run()
+    args = _parse_args(argv)
+
+    mcp = None
+    if os.environ.get("MCP_MEMORY_LAZY", "0").lower() not in ("", "0", "false", "no"):
+        from mcp_memory.lazy import create_lazy_server
+
+        mcp = create_lazy_server()
+    if mcp is None:
+        from mcp_memory.server import mcp
+
+    peer_specs = args.peer or [os.environ.get("MCP_MEMORY_PEERS", "")]
+    if any(peer_specs):
+        from mcp_memory.aggregator import configure_aggregator, parse_peers
+
+        try:
+            configure_aggregator(
+                mcp, parse_peers(peer_specs), timeout=args.peer_timeout
+            )
+        except ValueError as e:
+            raise SystemExit(f"mcp-memory: {e}") from e
+
+    if args.transport == "stdio" and args.socket is None:
+        mcp.run()
+        return
+
+    from mcp_memory.daemon import configure_shared, serve
+
+    configure_shared(
+        mcp,
+        snapshot_ttl=args.snapshot_ttl,
+        rate_limit=args.rate_limit,
+        max_concurrent=args.max_concurrent,
+        allow_kill=args.allow_kill,
+    )
+    serve(
+        mcp,
+        transport="http" if args.transport == "stdio" else args.transport,
+        host=args.host,
+        port=args.port,
+        socket_path=args.socket,
+    )
 
 
 if __name__ == "__main__":
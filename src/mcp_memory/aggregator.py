@@ -0,0 +1,332 @@
+"""Fan-out aggregation over several mcp-memory instances.
+
+An aggregating server queries a list of peer mcp-memory servers concurrently,
+each under its own timeout, and merges their answers with its own: top
+process lists are merged into one ranking and process groups are summed by
+name across hosts. Every row is tagged with the host it came from. Peers
+that fail or do not answer in time are reported instead of failing the call,
+so a slow host yields a partial result rather than none.
+
+Peers are configured with --peer (repeatable) or MCP_MEMORY_PEERS
+(comma-separated), as URLs optionally prefixed with a host label:
+
+    MCP_MEMORY_PEERS=build1=http://build1:8765/mcp,http://build2:8765/mcp
+"""
+
+import asyncio
+import socket
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+from fastmcp import Client, FastMCP
+
+from mcp_memory.defaults import DEFAULT_PEER_TIMEOUT
+from mcp_memory.models import (
+    HostProcessInfo,
+    PeerStatus,
+    PoolProcessGroup,
+    PoolProcessGroups,
+    PoolTopProcesses,
+)
+
+# Page size for reading every group of a host (the tools' maximum)
+GROUP_PAGE_SIZE = 100
+
+
+def parse_peers(specs: list[str]) -> dict[str, str]:
+    """
+    Parse peer specifications into a host label to URL mapping.
+
+    Each spec is a URL or `label=URL`; without a label the URL's host:port
+    is used. Comma-separated specs are split. Raises ValueError if two peers
+    get the same label.
+    """
+    peers: dict[str, str] = {}
+    for spec in specs:
+        for item in spec.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            label, sep, url = item.partition("=")
+            if not sep or "://" in label:
+                url = item
+                label = urlparse(url).netloc or url
+            if label in peers:
+                raise ValueError(f"Duplicate peer label: {label}")
+            peers[label] = url
+    return peers
+
+
+def _rows(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Convert a table-format tool result back into row dicts."""
+    columns = data["columns"]
+    return [dict(zip(columns, row)) for row in data["rows"]]
+
+
+class Aggregator:
+    """
+    Query peer mcp-memory servers concurrently and merge their results.
+
+    Args:
+        peers: Host label to client target (server URL, or a FastMCP instance
+               for in-process peers)
+        timeout: Seconds to wait for each peer
+        local: Label for this host's own results, or None to query peers only
+
+    Raises ValueError if a peer has the same label as the local host, whose
+    results would otherwise overwrite each other.
+    """
+
+    def __init__(
+        self,
+        peers: dict[str, Any],
+        timeout: float = DEFAULT_PEER_TIMEOUT,
+        local: str | None = None,
+    ) -> None:
+        if local is not None and local in peers:
+            raise ValueError(
+                f"Peer label {local!r} is this host's label; "
+                "give the peer another label with LABEL=URL"
+            )
+        self.peers = peers
+        self.timeout = timeout
+        self.local = local
+
+    async def _call_peer(
+        self, target: Any, tool: str, arguments: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Call a tool on one peer in table format and return its rows.
+
+        Paginated answers are followed to the last page, in one session.
+        """
+        rows: list[dict[str, Any]] = []
+        arguments = {**arguments, "format": "table"}
+        async with Client(target) as client:
+            while True:
+                result = await client.call_tool(tool, arguments)
+                data = result.structured_content
+                # Union return types are wrapped in {"result": ...}
+                data = data.get("result", data)
+                if "items" not in data:
+                    return rows + _rows(data)
+                rows += _rows(data["items"])
+                if not data["next_cursor"]:
+                    return rows
+                arguments = {"cursor": data["next_cursor"]}
+
+    async def _gather(
+        self,
+        tool: str,
+        arguments: dict[str, Any],
+        local: Any,
+    ) -> tuple[dict[str, list[dict[str, Any]]], list[PeerStatus]]:
+        """
+        Query every host concurrently, each under the peer timeout.
+
+        Returns rows per host that answered and the status of every host.
+        """
+        calls = {
+            host: self._call_peer(target, tool, arguments)
+            for host, target in self.peers.items()
+        }
+        if self.local is not None:
+            calls[self.local] = asyncio.to_thread(local)
+
+        async def timed(host: str, call) -> tuple[str, Any, float]:
+            start = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(call, self.timeout)
+            except TimeoutError:
+                result = TimeoutError(f"no answer within {self.timeout}s")
+            except Exception as e:
+                result = e
+            return host, result, (time.perf_counter() - start) * 1000
+
+        results: dict[str, list[dict[str, Any]]] = {}
+        statuses: list[PeerStatus] = []
+        for host, result, elapsed in await asyncio.gather(
+            *(timed(host, call) for host, call in calls.items())
+        ):
+            ok = not isinstance(result, Exception)
+            if ok:
+                results[host] = result
+            statuses.append(
+                PeerStatus(
+                    host=host,
+                    ok=ok,
+                    error=None if ok else f"{type(result).__name__}: {result}",
+                    elapsed_ms=round(elapsed, 1),
+                )
+            )
+        statuses.sort(key=lambda s: s.host)
+        return results, statuses
+
+    async def top_processes(
+        self, n: int = 10, sort_by: str = "memory"
+    ) -> PoolTopProcesses:
+        """
+        Merge the top N processes of every host into one ranking.
+
+        Each host returns its own top N, so the merged top N is exact for
+        every host that answered.
+        """
+        from mcp_memory.tools.processes import PROCESS_FIELDS, list_top_processes
+
+        n = min(max(1, n), 100)
+        fields = list(PROCESS_FIELDS)
+
+        def local() -> list[dict[str, Any]]:
+            return _rows(
+                list_top_processes(
+                    n=n, sort_by=sort_by, format="table", fields=fields
+                ).model_dump()
+            )
+
+        results, statuses = await self._gather(
+            "list_top_processes",
+            {"n": n, "sort_by": sort_by, "fields": fields},
+            local,
+        )
+        key = "cpu_percent" if sort_by == "cpu" else "memory_mb"
+        merged = sorted(
+            (
+                HostProcessInfo(host=host, **row)
+                for host, rows in results.items()
+                for row in rows
+            ),
+            key=lambda p: (-getattr(p, key), p.host, p.pid),
+        )
+        return PoolTopProcesses(
+            processes=merged[:n],
+            peers=statuses,
+            partial=not all(s.ok for s in statuses),
+        )
+
+    async def process_groups(
+        self,
+        n: int = 10,
+        min_count: int = 1,
+        group_by: str = "name",
+        pattern: str | None = None,
+    ) -> PoolProcessGroups:
+        """
+        Sum process groups by key across hosts.
+
+        Every group of every host is read, page by page, so totals are
+        complete for the hosts that answered; min_count applies to the summed
+        instance count.
+        """
+        from mcp_memory.tools.processes import GROUP_FIELDS, list_process_groups
+
+        n = min(max(1, n), 50)
+        fields = list(GROUP_FIELDS)
+        arguments: dict[str, Any] = {
+            "fields": fields,
+            "group_by": group_by,
+            "page_size": GROUP_PAGE_SIZE,
+        }
+        if pattern is not None:
+            arguments["pattern"] = pattern
+
+        def local() -> list[dict[str, Any]]:
+            rows: list[dict[str, Any]] = []
+            page = list_process_groups(format="table", **arguments)
+            while True:
+                rows += _rows(page.items.model_dump())
+                if page.next_cursor is None:
+                    return rows
+                page = list_process_groups(cursor=page.next_cursor)
+
+        results, statuses = await self._gather(
+            "list_process_groups", arguments, local
+        )
+        groups: dict[str, PoolProcessGroup] = {}
+        for host in sorted(results):
+            for row in results[host]:
+                group = groups.get(row["name"])
+                if group is None:
+                    group = groups[row["name"]] = PoolProcessGroup(
+                        name=row["name"], count=0, total_memory_mb=0.0, hosts={}
+                    )
+                group.count += row["count"]
+                group.total_memory_mb += row["total_memory_mb"]
+                group.hosts[host] = row["pids"]
+
+        summed = [g for g in groups.values() if g.count >= min_count]
+        for g in summed:
+            g.total_memory_mb = round(g.total_memory_mb, 2)
+        summed.sort(key=lambda g: (-g.total_memory_mb, g.name))
+        return PoolProcessGroups(
+            groups=summed[:n],
+            peers=statuses,
+            partial=not all(s.ok for s in statuses),
+        )
+
+
+def register_pool_tools(server: FastMCP, aggregator: Aggregator) -> None:
+    """Add the cross-host pool tools to a server."""
+
+    @server.tool()
+    async def list_pool_top_processes(
+        n: int = 10,
+        sort_by: str = "memory",
+    ) -> PoolTopProcesses:
+        """
+        List top N processes across this host and its configured peers.
+
+        Peers are queried concurrently; hosts that fail or exceed the peer
+        timeout are listed in `peers` and the result is marked partial.
+
+        Args:
+            n: Number of processes to return (default 10, max 100)
+            sort_by: Sort criterion - "memory" (default) or "cpu"
+
+        Returns:
+            Host-tagged processes merged across hosts, with per-host status
+        """
+        return await aggregator.top_processes(n=n, sort_by=sort_by)
+
+    @server.tool()
+    async def list_pool_process_groups(
+        n: int = 10,
+        min_count: int = 1,
+        group_by: str = "name",
+        pattern: str | None = None,
+    ) -> PoolProcessGroups:
+        """
+        List process groups summed by key across this host and its peers.
+
+        Args:
+            n: Number of groups to return (default 10, max 50)
+            min_count: Minimum instances across all hosts (default 1)
+            group_by: Grouping key as in list_process_groups - "name"
+                      (default), "exe", "cmdline", "user", "container"
+                      or "regex"
+            pattern: Regex for group_by="regex"
+
+        Returns:
+            Groups sorted by total memory, with process IDs per host
+        """
+        return await aggregator.process_groups(
+            n=n, min_count=min_count, group_by=group_by, pattern=pattern
+        )
+
+
+def configure_aggregator(
+    server: FastMCP,
+    peers: dict[str, Any],
+    timeout: float = DEFAULT_PEER_TIMEOUT,
+) -> Aggregator:
+    """
+    Turn a server into an aggregator over the given peers.
+
+    Args:
+        server: Server to add the pool tools to
+        peers: Host label to client target
+        timeout: Seconds to wait for each peer
+    """
+    aggregator = Aggregator(peers, timeout=timeout, local=socket.gethostname())
+    register_pool_tools(server, aggregator)
+    return aggregator
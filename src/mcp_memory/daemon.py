@@ -0,0 +1,242 @@
+"""Shared long-running server mode for many concurrent clients.
+
+A single daemon serves every agent on a host over HTTP, SSE or a Unix socket
+instead of one stdio server per session. Tool calls share process snapshots
+(see mcp_memory.snapshot), and each client is limited in request rate
+and in concurrent tool calls so one client cannot starve the others.
+
+The daemon does not authenticate clients. Its Unix socket is only accessible
+to the user running it, and kill_processes is not served unless enabled.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import os
+import socket
+import stat
+import struct
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from fastmcp import FastMCP
+from fastmcp.server.dependencies import get_http_request
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.server.middleware.rate_limiting import (
+    RateLimitError,
+    RateLimitingMiddleware,
+)
+from uvicorn.protocols.http.auto import AutoHTTPProtocol
+
+from mcp_memory import snapshot
+from mcp_memory.defaults import (
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_SNAPSHOT_TTL,
+)
+
+
+def client_id(context: MiddlewareContext) -> str:
+    """
+    Identify the client a request belongs to.
+
+    Uses the `client_id` request metadata if the client sends one, then the
+    session of stateful transports (Mcp-Session-Id header, SSE session_id),
+    then the client's connection: its address and port over TCP, or its
+    process over a Unix socket (see ClientAddressProtocol). Requests with
+    none of these (stdio) share a single "global" identity.
+    """
+    ctx = context.fastmcp_context
+    if ctx is not None and ctx.client_id:
+        return ctx.client_id
+    try:
+        request = get_http_request()
+    except RuntimeError:
+        return "global"
+    session = request.headers.get("mcp-session-id") or request.query_params.get(
+        "session_id"
+    )
+    if session:
+        return session
+    if request.client is None:
+        return "global"
+    host, port = request.client
+    return f"{host}:{port}"
+
+
+_connection_ids = itertools.count(1)
+
+
+def _peer_pid(transport: asyncio.BaseTransport) -> int | None:
+    """PID of the process at the other end of a Unix socket, if known."""
+    sock = transport.get_extra_info("socket")
+    if sock is None or not hasattr(socket, "SO_PEERCRED"):
+        return None
+    try:
+        creds = sock.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+    except OSError:
+        return None
+    pid, _, _ = struct.unpack("3i", creds)
+    return pid or None
+
+
+class ClientAddressProtocol(AutoHTTPProtocol):
+    """
+    uvicorn HTTP protocol that gives Unix socket connections a client address.
+
+    uvicorn leaves the client address of Unix socket connections empty, which
+    would put every local client under one limit. They are addressed by the
+    peer's PID instead, so each client process is limited on its own, or by a
+    connection number where the PID is unavailable.
+    """
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        super().connection_made(transport)
+        if self.client is None:
+            pid = _peer_pid(transport)
+            self.client = (
+                ("unix-pid", pid) if pid else ("unix", next(_connection_ids))
+            )
+
+
+class ConcurrencyLimitMiddleware(Middleware):
+    """Reject tool calls beyond a per-client number of in-flight calls."""
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        get_client_id: Callable[[MiddlewareContext], str] = client_id,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.get_client_id = get_client_id
+        self.in_flight: dict[str, int] = defaultdict(int)
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext,
+        call_next: CallNext,
+    ) -> Any:
+        client = self.get_client_id(context)
+        if self.in_flight[client] >= self.max_concurrent:
+            raise RateLimitError(
+                f"Too many concurrent tool calls for client: {client} "
+                f"(max {self.max_concurrent})"
+            )
+        self.in_flight[client] += 1
+        try:
+            return await call_next(context)
+        finally:
+            self.in_flight[client] -= 1
+            if self.in_flight[client] == 0:
+                del self.in_flight[client]
+
+
+class ScanRateLimitingMiddleware(RateLimitingMiddleware):
+    """
+    Per-client rate limit that lets cursor continuations through.
+
+    Later pages of a paginated listing are served from the retained result
+    set without scanning /proc, so reading a long listing page by page (as
+    the multi-host aggregator does) is not throttled like repeated scans.
+    """
+
+    async def on_request(
+        self,
+        context: MiddlewareContext,
+        call_next: CallNext,
+    ) -> Any:
+        if context.method == "tools/call" and (
+            getattr(context.message, "arguments", None) or {}
+        ).get("cursor"):
+            return await call_next(context)
+        return await super().on_request(context, call_next)
+
+
+def configure_shared(
+    server: FastMCP,
+    snapshot_ttl: float = DEFAULT_SNAPSHOT_TTL,
+    rate_limit: float = DEFAULT_RATE_LIMIT,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    allow_kill: bool = False,
+) -> None:
+    """
+    Prepare a server for many clients.
+
+    Args:
+        server: Server to configure
+        snapshot_ttl: Maximum age in seconds of shared process snapshots
+        rate_limit: Sustained requests per second per client, not counting
+                    cursor continuations (0 disables)
+        max_concurrent: In-flight tool calls per client (0 disables)
+        allow_kill: Serve kill_processes, letting any client that can reach
+                    the daemon signal processes with the daemon's privileges
+    """
+    snapshot.SNAPSHOT_TTL = snapshot_ttl
+    if not allow_kill:
+        server.disable(names={"kill_processes"}, components={"tool"})
+    if rate_limit > 0:
+        server.add_middleware(
+            ScanRateLimitingMiddleware(
+                max_requests_per_second=rate_limit,
+                get_client_id=client_id,
+            )
+        )
+    if max_concurrent > 0:
+        server.add_middleware(ConcurrencyLimitMiddleware(max_concurrent))
+
+
+def _bind_unix_socket(path: str) -> socket.socket:
+    """
+    Bind a Unix socket that only the current user can connect to.
+
+    uvicorn would create the socket world-writable, letting every local user
+    call tools with the daemon's privileges.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        sock.bind(path)
+    finally:
+        os.umask(umask)
+    return sock
+
+
+def serve(
+    server: FastMCP,
+    transport: str = "http",
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | None = None,
+) -> None:
+    """
+    Run a server on a network transport.
+
+    Args:
+        server: Server to run
+        transport: "http" (streamable HTTP) or "sse"
+        host: Interface to bind (ignored with socket_path)
+        port: TCP port to bind (ignored with socket_path)
+        socket_path: Serve on this Unix socket instead of TCP, accessible
+                     only to the current user
+    """
+    uvicorn_config: dict[str, Any] = {"http": ClientAddressProtocol}
+    if socket_path is not None:
+        sock = _bind_unix_socket(socket_path)
+        try:
+            server.run(
+                transport=transport, sockets=[sock], uvicorn_config=uvicorn_config
+            )
+        finally:
+            sock.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(socket_path)
+    else:
+        server.run(
+            transport=transport, host=host, port=port, uvicorn_config=uvicorn_config
+        )
@@ -0,0 +1,10 @@
+"""Default settings shared by the command line and the server modules.
+
+Kept free of imports so parsing the command line does not load the tool
+modules or build their models before a (possibly lazy) server starts.
+"""
+
+DEFAULT_SNAPSHOT_TTL = 2.0
+DEFAULT_RATE_LIMIT = 5.0
+DEFAULT_MAX_CONCURRENT = 2
+DEFAULT_PEER_TIMEOUT = 5.0
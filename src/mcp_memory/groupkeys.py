@@ -0,0 +1,192 @@
+"""Grouping keys for aggregating processes.
+
+Grouping by process name lumps every python3, node or java process together.
+GroupKeys holds the alternative keys list_process_groups can group by:
+
+- exe: resolved executable path
+- cmdline: interpreter plus script, module or main class
+  (e.g. "python3 -m pytest", "node server.js", "java org.gradle.Main")
+- user: owning user
+- container: container ID from the cgroup path, "host" for processes in this
+  server's PID namespace, otherwise the PID namespace ("pidns:<inode>")
+
+All keys of a process are computed together the first time it is seen and
+cached per (pid, create_time), so grouping the same processes by another key
+costs no further /proc reads. Keys are interned, so the many processes
+sharing a key share one string.
+"""
+
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+import psutil
+
+from mcp_memory.proctable import ProcessEntry
+
+GROUP_BY = ("name", "exe", "cmdline", "user", "container", "regex")
+
+# Filesystem root, overridable in tests
+PROC_ROOT = "/proc"
+
+# Cached processes before the cache is dropped and rebuilt
+MAX_CACHED = 65536
+
+_INTERPRETERS = re.compile(
+    r"(python|pypy|node|nodejs|deno|bun|ruby|perl|php|bash|sh|zsh|dash|lua|Rscript)"
+    r"[\d.]*"
+)
+# Per-interpreter options taking a separate value, which must not be mistaken
+# for the script
+_PYTHON_VALUE_OPTIONS = frozenset({"-W", "-X", "--check-hash-based-pycs"})
+_VALUE_OPTIONS = {
+    "python": _PYTHON_VALUE_OPTIONS,
+    "pypy": _PYTHON_VALUE_OPTIONS,
+    "node": frozenset({"-I", "-e", "-r", "--require", "--eval", "--import"}),
+    "nodejs": frozenset({"-I", "-e", "-r", "--require", "--eval", "--import"}),
+    "ruby": frozenset({"-I", "-e", "-r"}),
+    "perl": frozenset({"-I", "-e"}),
+}
+_JAVA_VALUE_OPTIONS = frozenset(
+    {"-cp", "-classpath", "--class-path", "-p", "--module-path", "--add-opens",
+     "--add-exports", "--add-modules", "-javaagent"}
+)
+# 64-hex container IDs as they appear in docker, containerd and podman cgroups
+_CONTAINER_ID = re.compile(r"([0-9a-f]{64})")
+
+
+@dataclass(frozen=True, slots=True)
+class GroupKeys:
+    """Interned grouping keys of one process."""
+
+    create_time: float
+    name: str
+    exe: str
+    cmdline: str
+    user: str
+    container: str
+    argv: str
+
+    def get(self, group_by: str, pattern: re.Pattern | None = None) -> str | None:
+        """
+        Key for a grouping; None if a regex grouping does not match.
+
+        With group_by="regex", the pattern is searched in the full command
+        line and the key is its first capture group, or the whole match if
+        the pattern has no groups or the first one did not participate.
+        """
+        if group_by != "regex":
+            return getattr(self, group_by)
+        match = pattern.search(self.argv) if pattern else None
+        if match is None:
+            return None
+        key = match.group(1) if match.re.groups else None
+        return sys.intern(match.group(0) if key is None else key)
+
+
+_cache: dict[int, GroupKeys] = {}
+_own_pidns: str | None = None
+
+
+def normalize_cmdline(argv: list[str], name: str) -> str:
+    """
+    Reduce a command line to its program: interpreter plus script for
+    scripting languages, java plus main class or jar, else the executable.
+    """
+    if not argv:
+        return name
+    program = os.path.basename(argv[0]) or name
+    args = iter(argv[1:])
+
+    if program == "java":
+        for arg in args:
+            if arg == "-jar":
+                return f"java -jar {os.path.basename(next(args, ''))}"
+            if arg in ("-m", "--module"):
+                return f"java -m {next(args, '')}"
+            if arg in _JAVA_VALUE_OPTIONS:
+                next(args, None)
+            elif not arg.startswith("-"):
+                return f"java {arg}"
+        return program
+
+    interpreter = _INTERPRETERS.fullmatch(program)
+    if interpreter:
+        family = interpreter.group(1)
+        value_options = _VALUE_OPTIONS.get(family, frozenset())
+        is_python = family in ("python", "pypy")
+        for arg in args:
+            if is_python and arg == "-m":
+                return f"{program} -m {next(args, '')}"
+            if is_python and arg == "-c":
+                return f"{program} -c"
+            if arg in value_options:
+                next(args, None)
+            elif not arg.startswith("-"):
+                return f"{program} {os.path.basename(arg)}"
+    return program
+
+
+def _read_link(path: str) -> str | None:
+    try:
+        return os.readlink(path)
+    except OSError:
+        return None
+
+
+def _container(pid: int) -> str:
+    """Container ID from the cgroup path, else the PID namespace."""
+    global _own_pidns
+    try:
+        with open(f"{PROC_ROOT}/{pid}/cgroup") as f:
+            match = _CONTAINER_ID.search(f.read())
+        if match:
+            return match.group(1)[:12]
+    except OSError:
+        pass
+
+    pidns = _read_link(f"{PROC_ROOT}/{pid}/ns/pid")
+    if pidns is None:
+        return "?"
+    if _own_pidns is None:
+        _own_pidns = _read_link(f"{PROC_ROOT}/self/ns/pid")
+    if pidns == _own_pidns:
+        return "host"
+    return "pidns:" + pidns.removeprefix("pid:[").removesuffix("]")
+
+
+def group_keys(proc: psutil.Process, entry: ProcessEntry | None) -> GroupKeys:
+    """
+    Grouping keys for a process, computed once per (pid, create_time).
+
+    Raises psutil errors if the process disappears before it is cached.
+    """
+    create_time = entry.create_time if entry else proc.create_time()
+    keys = _cache.get(proc.pid)
+    if keys is not None and keys.create_time == create_time:
+        return keys
+
+    name = entry.name if entry else proc.name()
+    try:
+        argv = proc.cmdline()
+    except psutil.AccessDenied:
+        argv = []
+    try:
+        exe = proc.exe() or name
+    except psutil.AccessDenied:
+        exe = name
+
+    keys = GroupKeys(
+        create_time=create_time,
+        name=sys.intern(name),
+        exe=sys.intern(exe),
+        cmdline=sys.intern(normalize_cmdline(argv, name)),
+        user=sys.intern(entry.username if entry else proc.username()),
+        container=sys.intern(_container(proc.pid)),
+        argv=sys.intern(" ".join(argv)),
+    )
+    if len(_cache) >= MAX_CACHED:
+        _cache.clear()
+    _cache[proc.pid] = keys
+    return keys
@@ -0,0 +1,78 @@
+"""Lazy-loading FastMCP server for fast cold starts.
+
+The eager server in mcp_memory.server imports every tool module and builds
+pydantic schemas for all tools before it can answer the first request. The
+lazy server instead registers placeholder tools from pre-built JSON schemas
+(schemas.json, generated from the eager server) and imports the real server
+on the first tool call.
+
+Regenerate the schemas after changing any tool signature or model:
+
+    python -m mcp_memory.lazy > src/mcp_memory/schemas.json
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+from fastmcp import FastMCP
+from fastmcp.tools import Tool, ToolResult
+
+SCHEMAS_PATH = Path(__file__).with_name("schemas.json")
+
+_load_lock = asyncio.Lock()
+
+
+class LazyTool(Tool):
+    """Tool advertised from a pre-built schema, loaded on first call."""
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        async with _load_lock:
+            # Imports all tool modules and builds their schemas, once
+            from mcp_memory.server import mcp
+
+        tool = await mcp.get_tool(self.name)
+        return await tool.run(arguments)
+
+
+async def dump_schemas() -> dict[str, Any]:
+    """Export the eager server's metadata and tool schemas."""
+    from mcp_memory.server import mcp
+
+    tools = sorted(await mcp.list_tools(), key=lambda t: t.name)
+    return {
+        "name": mcp.name,
+        "instructions": mcp.instructions,
+        "tools": [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.parameters,
+                "output_schema": tool.output_schema,
+            }
+            for tool in tools
+        ],
+    }
+
+
+def create_lazy_server(schemas_path: Path = SCHEMAS_PATH) -> FastMCP | None:
+    """
+    Build a server whose tools load on first use.
+
+    Returns None if no pre-built schemas are available, in which case callers
+    should fall back to the eager server.
+    """
+    try:
+        schemas = json.loads(schemas_path.read_text())
+    except FileNotFoundError:
+        return None
+
+    server = FastMCP(name=schemas["name"], instructions=schemas["instructions"])
+    for spec in schemas["tools"]:
+        server.add_tool(LazyTool(**spec))
+    return server
+
+
+if __name__ == "__main__":
+    print(json.dumps(asyncio.run(dump_schemas()), indent=2))
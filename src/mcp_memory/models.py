@@ -37,9 +37,9 @@ class ProcessInfo(BaseModel):
 
 
 class ProcessGroup(BaseModel):
-    """Aggregated information for processes with the same name."""
+    """Aggregated information for processes with the same grouping key."""
 
-    name: str = Field(description="Process name")
+    name: str = Field(description="Group key: process name unless grouped otherwise")
     count: int = Field(description="Number of instances")
     total_memory_mb: float = Field(description="Total memory usage in MB")
     total_memory_percent: float = Field(description="Total memory usage percentage")
@@ -63,3 +63,195 @@ class KillSummary(BaseModel):
     failed: int = Field(description="Number that failed")
     refused: int = Field(description="Number refused due to safety checks")
     results: list[KillResult] = Field(description="Per-PID results")
+
+
+class SwappedProcess(BaseModel):
+    """Swap usage of a single process."""
+
+    pid: int = Field(description="Process ID")
+    name: str = Field(description="Process name")
+    username: str = Field(description="Owner username")
+    swap_mb: float = Field(description="Swapped-out memory in MB (VmSwap)")
+    rss_mb: float = Field(description="Resident memory in MB (VmRSS)")
+
+
+class SwapGroup(BaseModel):
+    """Aggregated swap usage for processes with the same name."""
+
+    name: str = Field(description="Process name")
+    count: int = Field(description="Number of instances with swapped-out memory")
+    total_swap_mb: float = Field(description="Total swapped-out memory in MB")
+    pids: list[int] = Field(description="List of process IDs")
+
+
+class ZswapInfo(BaseModel):
+    """Compressed swap cache (zswap) statistics."""
+
+    enabled: bool = Field(description="Whether zswap is enabled")
+    compressor: str | None = Field(default=None, description="Compression algorithm")
+    pool_mb: float | None = Field(
+        default=None, description="Memory used by the compressed pool in MB"
+    )
+    stored_mb: float | None = Field(
+        default=None, description="Uncompressed size of pages stored in zswap in MB"
+    )
+
+
+class ZramDevice(BaseModel):
+    """Statistics for a single zram block device."""
+
+    device: str = Field(description="Device name (e.g., 'zram0')")
+    disksize_mb: float = Field(description="Configured device size in MB")
+    orig_data_mb: float = Field(description="Uncompressed size of stored data in MB")
+    compr_data_mb: float = Field(description="Compressed size of stored data in MB")
+    mem_used_mb: float = Field(description="Total memory used by the device in MB")
+    compression_ratio: float | None = Field(
+        default=None, description="orig_data / compr_data, if any data is stored"
+    )
+
+
+class SwapReport(BaseModel):
+    """Per-process attribution of swap usage."""
+
+    swap_total_mb: float = Field(description="Total swap in MB")
+    swap_used_mb: float = Field(description="Used swap in MB")
+    attributed_swap_mb: float = Field(
+        description="Swap attributed to processes via VmSwap in MB "
+        "(the rest is shmem/tmpfs or not visible to this user)"
+    )
+    processes: list[SwappedProcess] = Field(
+        description="Processes sorted by swapped-out memory descending"
+    )
+    groups: list[SwapGroup] = Field(
+        description="Process groups sorted by swapped-out memory descending"
+    )
+    zswap: ZswapInfo | None = Field(default=None, description="zswap stats if present")
+    zram: list[ZramDevice] = Field(
+        default_factory=list, description="zram devices if present"
+    )
+
+
+class MemoryMapping(BaseModel):
+    """A single memory mapping from /proc/[pid]/smaps."""
+
+    address: str = Field(description="Address range (e.g., '7f12a000-7f12c000')")
+    perms: str = Field(description="Permissions (e.g., 'rw-p')")
+    path: str = Field(description="Backing path or pseudo-path ('' for anonymous)")
+    category: str = Field(
+        description="Mapping category: heap, stack, anon, shmem, file or special"
+    )
+    size_mb: float = Field(description="Virtual size in MB")
+    rss_mb: float = Field(description="Resident memory in MB")
+    pss_mb: float = Field(description="Proportional set size in MB")
+    swap_mb: float = Field(description="Swapped-out memory in MB")
+
+
+class MappingGroup(BaseModel):
+    """Aggregated memory usage for mappings sharing a category or path."""
+
+    key: str = Field(description="Category name or backing path")
+    category: str = Field(description="Mapping category")
+    count: int = Field(description="Number of mappings")
+    size_mb: float = Field(description="Total virtual size in MB")
+    rss_mb: float = Field(description="Total resident memory in MB")
+    pss_mb: float = Field(description="Total proportional set size in MB")
+    swap_mb: float = Field(description="Total swapped-out memory in MB")
+
+
+class ProcessMemoryMap(BaseModel):
+    """Breakdown of a process's memory by mapping."""
+
+    pid: int = Field(description="Process ID")
+    name: str = Field(description="Process name")
+    mapping_count: int = Field(description="Total number of mappings")
+    rss_mb: float = Field(description="Total resident memory in MB")
+    pss_mb: float = Field(description="Total proportional set size in MB")
+    swap_mb: float = Field(description="Total swapped-out memory in MB")
+    categories: list[MappingGroup] = Field(
+        description="Totals per mapping category, sorted descending"
+    )
+    top_paths: list[MappingGroup] = Field(
+        description="Top backing paths aggregated across mappings, sorted descending"
+    )
+    top_mappings: list[MemoryMapping] = Field(
+        description="Largest individual mappings, sorted descending"
+    )
+
+
+class TableResult(BaseModel):
+    """Compact tabular response: a column header and one array per row."""
+
+    columns: list[str] = Field(description="Column names, in row order")
+    rows: list[list[int | float | str | list[int]]] = Field(
+        description="One array of values per row, aligned with columns"
+    )
+
+
+class ProcessPage(BaseModel):
+    """One page of a paginated process listing."""
+
+    items: list[ProcessInfo] | TableResult = Field(
+        description="Processes on this page, as objects or a table"
+    )
+    total: int = Field(description="Number of processes in the whole result set")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Pass as `cursor` to fetch the next page; null on the last page",
+    )
+
+
+class ProcessGroupPage(BaseModel):
+    """One page of a paginated process group listing."""
+
+    items: list[ProcessGroup] | TableResult = Field(
+        description="Groups on this page, as objects or a table"
+    )
+    total: int = Field(description="Number of groups in the whole result set")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Pass as `cursor` to fetch the next page; null on the last page",
+    )
+
+
+class HostProcessInfo(ProcessInfo):
+    """Process information tagged with the host it runs on."""
+
+    host: str = Field(description="Host the process runs on")
+
+
+class PoolProcessGroup(BaseModel):
+    """Processes with the same grouping key aggregated across hosts."""
+
+    name: str = Field(description="Group key: process name unless grouped otherwise")
+    count: int = Field(description="Number of instances across all hosts")
+    total_memory_mb: float = Field(description="Total memory usage in MB")
+    hosts: dict[str, list[int]] = Field(description="Process IDs per host")
+
+
+class PeerStatus(BaseModel):
+    """Outcome of querying one host."""
+
+    host: str = Field(description="Host name")
+    ok: bool = Field(description="Whether the host answered in time")
+    error: str | None = Field(default=None, description="Error if the host failed")
+    elapsed_ms: float = Field(description="Time taken to answer or fail")
+
+
+class PoolTopProcesses(BaseModel):
+    """Top processes merged across hosts."""
+
+    processes: list[HostProcessInfo] = Field(
+        description="Processes sorted by the requested criterion across hosts"
+    )
+    peers: list[PeerStatus] = Field(description="Per-host query status")
+    partial: bool = Field(description="True if some hosts did not answer")
+
+
+class PoolProcessGroups(BaseModel):
+    """Process groups summed across hosts."""
+
+    groups: list[PoolProcessGroup] = Field(
+        description="Groups sorted by total memory across hosts"
+    )
+    peers: list[PeerStatus] = Field(description="Per-host query status")
+    partial: bool = Field(description="True if some hosts did not answer")
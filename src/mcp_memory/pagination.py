@@ -0,0 +1,152 @@
+"""Cursor-based pagination over retained result sets.
+
+The first page of a paginated query scans /proc once and keeps the matching
+rows as a ResultSet. Later pages are served from that retained set, so every
+page comes from the same consistent view and no page rescans. Rows are kept
+as a heap and popped in sort order only as far as the pages requested, so a
+caller reading one page of a large set pays O(N + k log N) rather than a full
+sort.
+
+Cursors are opaque tokens naming a result set, an offset and a page size.
+Result sets expire after CURSOR_TTL seconds (MCP_MEMORY_CURSOR_TTL) and at
+most MAX_RESULT_SETS are retained, oldest evicted first.
+"""
+
+import base64
+import heapq
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+CURSOR_TTL = float(os.environ.get("MCP_MEMORY_CURSOR_TTL", "300"))
+MAX_RESULT_SETS = 32
+MAX_PAGE_SIZE = 100
+
+
+class ResultSet:
+    """
+    Rows of one query, materialized in sort order on demand.
+
+    Args:
+        rows: Matching rows
+        key: Sort key; rows are returned in ascending key order
+        meta: Query settings needed to render later pages (format, columns)
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[dict],
+        key: Callable[[dict], Any],
+        meta: dict[str, Any] | None = None,
+    ) -> None:
+        self._heap = [(key(row), i, row) for i, row in enumerate(rows)]
+        heapq.heapify(self._heap)
+        self._sorted: list[dict] = []
+        self._lock = threading.Lock()
+        self.total = len(self._heap)
+        self.meta = meta or {}
+        self.created = time.monotonic()
+
+    def page(self, offset: int, size: int) -> list[dict]:
+        """Return rows [offset, offset + size), popping only as far as needed."""
+        with self._lock:
+            while len(self._sorted) < offset + size and self._heap:
+                self._sorted.append(heapq.heappop(self._heap)[2])
+            return self._sorted[offset : offset + size]
+
+
+def encode_cursor(set_id: str, offset: int, size: int) -> str:
+    """Build an opaque cursor for a page of a result set."""
+    raw = f"{set_id}:{offset}:{size}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int, int]:
+    """Split a cursor into (set_id, offset, size), raising ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        set_id, offset, size = raw.split(":")
+        if int(offset) < 0:
+            raise ValueError(offset)
+        return set_id, int(offset), int(size)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class CursorStore:
+    """Bounded, expiring store of result sets addressed by cursors."""
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        max_sets: int = MAX_RESULT_SETS,
+    ) -> None:
+        self.ttl = ttl
+        self.max_sets = max_sets
+        self._sets: OrderedDict[str, ResultSet] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire(self) -> None:
+        ttl = CURSOR_TTL if self.ttl is None else self.ttl
+        now = time.monotonic()
+        while self._sets:
+            set_id, oldest = next(iter(self._sets.items()))
+            if now - oldest.created <= ttl and len(self._sets) <= self.max_sets:
+                break
+            del self._sets[set_id]
+
+    def add(self, result_set: ResultSet) -> str:
+        """Retain a result set and return its id."""
+        set_id = secrets.token_urlsafe(8)
+        with self._lock:
+            self._sets[set_id] = result_set
+            self._expire()
+        return set_id
+
+    def get(self, set_id: str) -> ResultSet:
+        """Look up a retained result set, raising ValueError if it expired."""
+        with self._lock:
+            self._expire()
+            result_set = self._sets.get(set_id)
+        if result_set is None:
+            raise ValueError("Cursor expired or unknown; start again without a cursor")
+        return result_set
+
+    def page(
+        self,
+        cursor: str | None,
+        size: int | None,
+        build: Callable[[], ResultSet],
+    ) -> tuple[ResultSet, list[dict], str | None]:
+        """
+        Serve one page.
+
+        Without a cursor, calls build() for a new result set and serves its
+        first page. With a cursor, continues the retained set it names without
+        calling build(); size then defaults to the cursor's page size.
+
+        Returns:
+            The result set, the page's rows and the cursor of the next page
+            (None on the last page)
+        """
+        if cursor is None:
+            result_set = build()
+            set_id, offset = self.add(result_set), 0
+        else:
+            set_id, offset, cursor_size = decode_cursor(cursor)
+            result_set = self.get(set_id)
+            size = size or cursor_size
+        size = min(max(1, size or 0), MAX_PAGE_SIZE)
+
+        rows = result_set.page(offset, size)
+        next_offset = offset + len(rows)
+        next_cursor = (
+            encode_cursor(set_id, next_offset, size)
+            if next_offset < result_set.total
+            else None
+        )
+        return result_set, rows, next_cursor
@@ -0,0 +1,400 @@
+"""Live process table maintained incrementally from process events.
+
+Instead of re-enumerating /proc on every tool call, a ProcessTable keeps the
+set of live PIDs and their static attributes (name, owner, start time,
+command line) up to date from fork/exec/exit events. Events come from the
+kernel proc connector when the server has CAP_NET_ADMIN, and otherwise from
+periodic diff scans of the PID list.
+
+The table is opt-in via the MCP_MEMORY_PROC_TABLE environment variable:
+
+- unset or "0": disabled, tools use psutil.process_iter()
+- "1" or "auto": proc connector, falling back to diff scans
+- "poll": diff scans only (interval from MCP_MEMORY_PROC_TABLE_INTERVAL)
+"""
+
+import errno
+import logging
+import os
+import socket
+import struct
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import NamedTuple, Protocol
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+# Event kinds; RESYNC asks the table to rebuild after events were lost
+FORK = "fork"
+EXEC = "exec"
+EXIT = "exit"
+RESYNC = "resync"
+
+DEFAULT_POLL_INTERVAL = 5.0
+
+# Netlink proc connector constants (linux/connector.h, linux/cn_proc.h)
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+NLMSG_DONE = 3
+PROC_CN_MCAST_LISTEN = 1
+PROC_CN_MCAST_IGNORE = 2
+PROC_EVENT_FORK = 0x00000001
+PROC_EVENT_EXEC = 0x00000002
+PROC_EVENT_EXIT = 0x80000000
+
+_NLMSGHDR = struct.Struct("=IHHII")
+_CN_MSG = struct.Struct("=IIIIHH")
+_PROC_EVENT = struct.Struct("=IIQ")
+_PID_PAIR = struct.Struct("=ii")
+
+
+class ProcEvent(NamedTuple):
+    """A process lifecycle event."""
+
+    kind: str
+    pid: int
+
+
+class EventSource(Protocol):
+    """A blocking stream of process events."""
+
+    def events(self) -> Iterator[ProcEvent]:
+        """Yield events until closed."""
+        ...
+
+    def close(self) -> None:
+        """Stop the event stream, unblocking events()."""
+        ...
+
+
+@dataclass(slots=True)
+class ProcessEntry:
+    """Static attributes of a live process, cached across tool calls."""
+
+    pid: int
+    name: str
+    username: str
+    create_time: float
+    cmdline: str
+    process: psutil.Process
+
+
+def load_entry(pid: int) -> ProcessEntry | None:
+    """Read static attributes for a PID, returning None if it disappears."""
+    try:
+        proc = psutil.Process(pid)
+        with proc.oneshot():
+            try:
+                cmdline = " ".join(proc.cmdline())
+            except psutil.AccessDenied:
+                cmdline = ""
+            return ProcessEntry(
+                pid=pid,
+                name=proc.name(),
+                username=proc.username(),
+                create_time=proc.create_time(),
+                cmdline=cmdline,
+                process=proc,
+            )
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+
+
+def is_current(entry: ProcessEntry) -> bool:
+    """
+    Whether the entry's PID still belongs to the process it was loaded from.
+
+    Reads the start time afresh: psutil caches it per Process object, so the
+    entry's own process cannot tell that its PID was reused.
+    """
+    try:
+        return psutil.Process(entry.pid).create_time() == entry.create_time
+    except psutil.Error:
+        return False
+
+
+class NetlinkEventSource:
+    """
+    Process events from the kernel proc connector.
+
+    Subscribing requires CAP_NET_ADMIN; the constructor raises PermissionError
+    (or another OSError) when the connector is unavailable.
+    """
+
+    def __init__(self) -> None:
+        self._closed = threading.Event()
+        self._sock = socket.socket(
+            socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR
+        )
+        try:
+            self._sock.bind((0, CN_IDX_PROC))
+            self._send_op(PROC_CN_MCAST_LISTEN)
+        except OSError:
+            self._sock.close()
+            raise
+        # Wake up periodically so close() is noticed
+        self._sock.settimeout(1.0)
+
+    def _send_op(self, op: int) -> None:
+        payload = struct.pack("=I", op)
+        cn_msg = _CN_MSG.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(payload), 0)
+        length = _NLMSGHDR.size + len(cn_msg) + len(payload)
+        header = _NLMSGHDR.pack(length, NLMSG_DONE, 0, 0, os.getpid())
+        self._sock.send(header + cn_msg + payload)
+
+    def events(self) -> Iterator[ProcEvent]:
+        while not self._closed.is_set():
+            try:
+                data = self._sock.recv(4096)
+            except TimeoutError:
+                continue
+            except OSError as e:
+                if self._closed.is_set():
+                    return
+                if e.errno == errno.ENOBUFS:
+                    # The receive buffer overran and events were dropped
+                    yield ProcEvent(RESYNC, 0)
+                    continue
+                raise
+            yield from parse_netlink_events(data)
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            self._send_op(PROC_CN_MCAST_IGNORE)
+        except OSError:
+            pass
+        self._sock.close()
+
+
+def parse_netlink_events(data: bytes) -> Iterator[ProcEvent]:
+    """
+    Parse proc connector events from a netlink datagram.
+
+    Thread events (pid != tgid) are dropped: the table only tracks processes.
+    """
+    offset = 0
+    while offset + _NLMSGHDR.size <= len(data):
+        length = _NLMSGHDR.unpack_from(data, offset)[0]
+        if length < _NLMSGHDR.size:
+            return
+        event_offset = offset + _NLMSGHDR.size + _CN_MSG.size
+        what = _PROC_EVENT.unpack_from(data, event_offset)[0]
+        body = event_offset + _PROC_EVENT.size
+
+        if what == PROC_EVENT_FORK:
+            # parent_pid, parent_tgid, child_pid, child_tgid
+            pid, tgid = _PID_PAIR.unpack_from(data, body + _PID_PAIR.size)
+            if pid == tgid:
+                yield ProcEvent(FORK, pid)
+        elif what == PROC_EVENT_EXEC:
+            pid, tgid = _PID_PAIR.unpack_from(data, body)
+            if pid == tgid:
+                yield ProcEvent(EXEC, pid)
+        elif what == PROC_EVENT_EXIT:
+            pid, tgid = _PID_PAIR.unpack_from(data, body)
+            if pid == tgid:
+                yield ProcEvent(EXIT, pid)
+
+        # Messages are aligned to 4 bytes
+        offset += (length + 3) & ~3
+
+
+class PollingEventSource:
+    """
+    Synthesize fork/exit events by diffing the PID list periodically.
+
+    Used when the proc connector is not available. Exec events cannot be
+    observed this way, so command lines of processes that exec without
+    forking are refreshed only when the PID is reused.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        list_pids: Callable[[], list[int]] = psutil.pids,
+    ) -> None:
+        self._interval = interval
+        self._list_pids = list_pids
+        self._closed = threading.Event()
+
+    def events(self) -> Iterator[ProcEvent]:
+        known: set[int] = set()
+        while not self._closed.is_set():
+            current = set(self._list_pids())
+            for pid in sorted(known - current):
+                yield ProcEvent(EXIT, pid)
+            for pid in sorted(current - known):
+                yield ProcEvent(FORK, pid)
+            known = current
+            self._closed.wait(self._interval)
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+def open_event_source(
+    mode: str = "auto",
+    interval: float = DEFAULT_POLL_INTERVAL,
+) -> EventSource:
+    """Open the proc connector, falling back to diff scans without privilege."""
+    if mode != "poll":
+        try:
+            return NetlinkEventSource()
+        except (OSError, AttributeError):
+            # AttributeError: no AF_NETLINK outside Linux
+            pass
+    return PollingEventSource(interval=interval)
+
+
+class ProcessTable:
+    """
+    Set of live processes kept up to date from an event source.
+
+    The event source and the attribute loader are injectable so both the
+    connector and the diff-scan modes can be driven from tests. If the event
+    source fails, the table rescans and continues from diff scans every
+    `fallback_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        source: EventSource,
+        load: Callable[[int], ProcessEntry | None] = load_entry,
+        list_pids: Callable[[], list[int]] = psutil.pids,
+        fallback_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        self._source = source
+        self._load = load
+        self._list_pids = list_pids
+        self._fallback_interval = fallback_interval
+        self._entries: dict[int, ProcessEntry] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._entries
+
+    def get(self, pid: int) -> ProcessEntry | None:
+        """Return the cached entry for a PID, if live."""
+        return self._entries.get(pid)
+
+    def snapshot(self) -> list[ProcessEntry]:
+        """Return the current entries, sorted by PID."""
+        with self._lock:
+            return [self._entries[pid] for pid in sorted(self._entries)]
+
+    def apply(self, event: ProcEvent) -> None:
+        """Update the table for a single event."""
+        if event.kind == RESYNC:
+            self.scan()
+            return
+
+        if event.kind == EXIT:
+            with self._lock:
+                self._entries.pop(event.pid, None)
+            return
+
+        # fork of an already-known PID is a duplicate unless the PID was reused
+        existing = self._entries.get(event.pid)
+        if event.kind == FORK and existing is not None and is_current(existing):
+            return
+
+        self.reload(event.pid)
+
+    def reload(self, pid: int) -> ProcessEntry | None:
+        """Reload the entry for a PID, dropping it if the process is gone."""
+        entry = self._load(pid)
+        with self._lock:
+            if entry is None:
+                self._entries.pop(pid, None)
+            else:
+                self._entries[pid] = entry
+        return entry
+
+    def scan(self) -> None:
+        """Rebuild the table from a full PID listing."""
+        entries = {}
+        for pid in self._list_pids():
+            entry = self._load(pid)
+            if entry is not None:
+                entries[pid] = entry
+        with self._lock:
+            self._entries = entries
+
+    def start(self) -> None:
+        """Load the initial table and follow events in a background thread."""
+        self.scan()
+        self._thread = threading.Thread(
+            target=self._run, name="mcp-memory-proctable", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Close the event source and wait for the follower thread."""
+        self._stopped.set()
+        self._source.close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        resync = False
+        while not self._stopped.is_set():
+            try:
+                if resync:
+                    self.scan()
+                for event in self._source.events():
+                    self.apply(event)
+                return
+            except Exception:
+                if self._stopped.is_set():
+                    return
+                # A dead follower would freeze the table for the server's
+                # lifetime, so resync and continue from diff scans
+                logger.warning(
+                    "Process event source failed; falling back to diff scans",
+                    exc_info=True,
+                )
+                try:
+                    self._source.close()
+                except Exception:
+                    pass
+                self._source = PollingEventSource(
+                    self._fallback_interval, self._list_pids
+                )
+                resync = True
+                self._stopped.wait(self._fallback_interval)
+
+
+_table: ProcessTable | None = None
+_table_lock = threading.Lock()
+
+
+def get_process_table() -> ProcessTable | None:
+    """Return the shared process table, starting it on first use if enabled."""
+    global _table
+    mode = os.environ.get("MCP_MEMORY_PROC_TABLE", "0").lower()
+    if mode in ("", "0", "false", "no"):
+        return None
+
+    with _table_lock:
+        if _table is None:
+            interval = float(
+                os.environ.get("MCP_MEMORY_PROC_TABLE_INTERVAL", DEFAULT_POLL_INTERVAL)
+            )
+            _table = ProcessTable(
+                open_event_source(mode, interval), fallback_interval=interval
+            )
+            _table.start()
+    return _table
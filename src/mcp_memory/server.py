@@ -2,7 +2,17 @@
 
 from fastmcp import FastMCP
 
-from mcp_memory.models import KillSummary, MemoryInfo, ProcessGroup, ProcessInfo
+from mcp_memory.models import (
+    KillSummary,
+    MemoryInfo,
+    ProcessGroup,
+    ProcessGroupPage,
+    ProcessInfo,
+    ProcessMemoryMap,
+    ProcessPage,
+    SwapReport,
+    TableResult,
+)
 from mcp_memory.tools.kill import kill_processes as _kill_processes
 from mcp_memory.tools.memory import list_memory_usage as _list_memory_usage
 from mcp_memory.tools.processes import (
@@ -10,6 +20,8 @@ from mcp_memory.tools.processes import (
     list_process_groups as _list_process_groups,
     list_top_processes as _list_top_processes,
 )
+from mcp_memory.tools.smaps import inspect_process_memory as _inspect_process_memory
+from mcp_memory.tools.swap import list_swapped_processes as _list_swapped_processes
 
 mcp = FastMCP(
     name="mcp-memory",
@@ -18,8 +30,10 @@ mcp = FastMCP(
 Available tools:
 - list_memory_usage: Get system memory summary (like `free -h`)
 - list_top_processes: Find top memory/CPU consumers
-- list_process_groups: Aggregate processes by name with totals
+- list_process_groups: Aggregate processes by name, command, user or container
 - find_stale_processes: Find old/idle processes by criteria
+- list_swapped_processes: Find which processes are swapped out
+- inspect_process_memory: Break down one process's memory by mapping
 - kill_processes: Terminate processes with safety checks
 """,
 )
@@ -40,27 +54,56 @@ def list_memory_usage() -> MemoryInfo:
 def list_top_processes(
     n: int = 10,
     sort_by: str = "memory",
-) -> list[ProcessInfo]:
+    format: str = "object",
+    fields: list[str] | None = None,
+    cmdline_max: int = 200,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> list[ProcessInfo] | TableResult | ProcessPage:
     """
     List top N memory-consuming processes.
 
     Args:
         n: Number of processes to return (default 10, max 100)
         sort_by: Sort criterion - "memory" (default) or "cpu"
+        format: "object" (default) or "table" for a compact column header
+                plus row arrays
+        fields: Columns to collect, e.g. ["pid", "name", "memory_mb"];
+                requires format="table". Unrequested attributes are not read.
+        cmdline_max: Maximum command line length (default 200)
+        page_size: Page through all processes, this many per page (max 100),
+                   instead of returning the top n
+        cursor: next_cursor from a previous page, to fetch the next one from
+                the same snapshot (other arguments are ignored)
 
     Returns:
-        List of processes sorted by the specified criterion
+        Processes sorted by the specified criterion, or a page with
+        next_cursor when paginating
     """
-    return _list_top_processes(n=n, sort_by=sort_by)
+    return _list_top_processes(
+        n=n,
+        sort_by=sort_by,
+        format=format,
+        fields=fields,
+        cmdline_max=cmdline_max,
+        page_size=page_size,
+        cursor=cursor,
+    )
 
 
 @mcp.tool()
 def list_process_groups(
     n: int = 10,
     min_count: int = 1,
-) -> list[ProcessGroup]:
+    format: str = "object",
+    fields: list[str] | None = None,
+    group_by: str = "name",
+    pattern: str | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> list[ProcessGroup] | TableResult | ProcessGroupPage:
     """
-    List processes grouped by name with aggregated stats.
+    List processes grouped by name or another key, with aggregated stats.
 
     Useful for seeing total resource usage by process type
     (e.g., "3 claude processes using 1.6GB total").
@@ -68,11 +111,35 @@ def list_process_groups(
     Args:
         n: Number of groups to return (default 10, max 50)
         min_count: Minimum number of instances to include (default 1)
+        format: "object" (default) or "table" for a compact column header
+                plus row arrays
+        fields: Columns to return, e.g. ["name", "count"]; requires
+                format="table"
+        group_by: Grouping key - "name" (default), "exe", "cmdline"
+                  (interpreter plus script/main class, e.g. "python3 -m
+                  pytest"), "user", "container" or "regex"
+        pattern: For group_by="regex": regex searched in the full command
+                 line; groups by its first capture group (or whole match),
+                 leaving out processes that do not match
+        page_size: Page through all groups, this many per page (max 100),
+                   instead of returning the top n
+        cursor: next_cursor from a previous page, to fetch the next one from
+                the same snapshot (other arguments are ignored)
 
     Returns:
-        List of process groups sorted by total memory usage descending
+        Process groups sorted by total memory usage descending, or a page
+        with next_cursor when paginating
     """
-    return _list_process_groups(n=n, min_count=min_count)
+    return _list_process_groups(
+        n=n,
+        min_count=min_count,
+        format=format,
+        fields=fields,
+        group_by=group_by,
+        pattern=pattern,
+        page_size=page_size,
+        cursor=cursor,
+    )
 
 
 @mcp.tool()
@@ -81,7 +148,12 @@ def find_stale_processes(
     states: list[str] | None = None,
     name_pattern: str | None = None,
     min_memory_mb: float = 0,
-) -> list[ProcessInfo]:
+    format: str = "object",
+    fields: list[str] | None = None,
+    cmdline_max: int = 200,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> list[ProcessInfo] | TableResult | ProcessPage:
     """
     Find potentially stale processes based on various criteria.
 
@@ -94,18 +166,78 @@ def find_stale_processes(
                 Valid: sleeping, zombie, stopped, idle, running, disk-sleep
         name_pattern: Regex pattern to match process names (e.g., "ghc|cabal")
         min_memory_mb: Minimum memory usage in MB (default 0)
+        format: "object" (default) or "table" for a compact column header
+                plus row arrays
+        fields: Columns to collect, e.g. ["pid", "name", "age_hours"];
+                requires format="table". Unrequested attributes are not read.
+        cmdline_max: Maximum command line length (default 200)
+        page_size: Return matches this many per page (max 100); recommended
+                   on busy hosts, where matches can number in the thousands
+        cursor: next_cursor from a previous page, to fetch the next one from
+                the same snapshot (other arguments are ignored)
 
     Returns:
-        List of matching processes, sorted by memory usage descending
+        Matching processes, sorted by memory usage descending, or a page
+        with next_cursor when paginating
     """
     return _find_stale_processes(
         min_age_hours=min_age_hours,
         states=states,
         name_pattern=name_pattern,
         min_memory_mb=min_memory_mb,
+        format=format,
+        fields=fields,
+        cmdline_max=cmdline_max,
+        page_size=page_size,
+        cursor=cursor,
     )
 
 
+@mcp.tool()
+def list_swapped_processes(
+    n: int = 10,
+    min_swap_mb: float = 0,
+) -> SwapReport:
+    """
+    List processes and process groups ranked by swapped-out memory.
+
+    Useful for deciding what to restart when swap usage is high.
+    Also reports zswap/zram compression stats when present.
+
+    Args:
+        n: Number of processes and groups to return (default 10, max 100)
+        min_swap_mb: Minimum swapped-out memory in MB to include (default 0)
+
+    Returns:
+        Swap totals, top swapped processes and groups, zswap/zram stats
+    """
+    return _list_swapped_processes(n=n, min_swap_mb=min_swap_mb)
+
+
+@mcp.tool()
+def inspect_process_memory(
+    pid: int,
+    n: int = 10,
+    sort_by: str = "rss",
+) -> ProcessMemoryMap:
+    """
+    Break down a single process's memory by mapping category and path.
+
+    Shows whether a large process is dominated by heap, anonymous mmap,
+    file-backed mappings or shared memory. Works on processes with
+    very large numbers of mappings (JVMs, browsers).
+
+    Args:
+        pid: Process ID to inspect
+        n: Number of top paths and mappings to return (default 10, max 100)
+        sort_by: Ranking criterion - "rss" (default), "pss" or "swap"
+
+    Returns:
+        Per-category totals, top backing paths and largest mappings
+    """
+    return _inspect_process_memory(pid=pid, n=n, sort_by=sort_by)
+
+
 @mcp.tool()
 def kill_processes(
     pids: list[int],
@@ -0,0 +1,47 @@
+"""Shared, time-bounded snapshots of expensive /proc scans.
+
+When many clients share one server, each tool call would otherwise walk /proc
+on its own. A SnapshotCache lets concurrent and closely spaced calls reuse
+one scan, so /proc load stays constant as the number of clients grows.
+
+SNAPSHOT_TTL (MCP_MEMORY_SNAPSHOT_TTL, seconds) is the maximum snapshot age;
+0 disables sharing so every call scans afresh.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+SNAPSHOT_TTL = float(os.environ.get("MCP_MEMORY_SNAPSHOT_TTL", "0"))
+
+
+class SnapshotCache(Generic[T]):
+    """
+    Single-flight cache for the result of a scan.
+
+    Callers arriving while a scan is in progress wait for it and share its
+    result instead of starting their own.
+    """
+
+    def __init__(self, scan: Callable[[], T]) -> None:
+        self._scan = scan
+        self._lock = threading.Lock()
+        self._value: T | None = None
+        self._taken = 0.0
+
+    def get(self, max_age: float) -> T:
+        """Return a snapshot no older than max_age seconds, rescanning if needed."""
+        with self._lock:
+            if self._value is None or time.monotonic() - self._taken > max_age:
+                self._value = self._scan()
+                self._taken = time.monotonic()
+            return self._value
+
+    def invalidate(self) -> None:
+        """Drop the current snapshot so the next get() rescans."""
+        with self._lock:
+            self._value = None
@@ -3,10 +3,14 @@
 from mcp_memory.tools.kill import kill_processes
 from mcp_memory.tools.memory import list_memory_usage
 from mcp_memory.tools.processes import find_stale_processes, list_top_processes
+from mcp_memory.tools.smaps import inspect_process_memory
+from mcp_memory.tools.swap import list_swapped_processes
 
 __all__ = [
     "list_memory_usage",
     "list_top_processes",
     "find_stale_processes",
+    "list_swapped_processes",
+    "inspect_process_memory",
     "kill_processes",
 ]
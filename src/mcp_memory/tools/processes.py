@@ -1,12 +1,62 @@
 """Process inspection tools."""
 
+import heapq
+import multiprocessing
+import os
 import re
+import threading
 import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
+from typing import Any
 
 import psutil
 
-from mcp_memory.models import ProcessGroup, ProcessInfo
+from mcp_memory import snapshot
+from mcp_memory.groupkeys import GROUP_BY, group_keys
+from mcp_memory.models import (
+    ProcessGroup,
+    ProcessGroupPage,
+    ProcessInfo,
+    ProcessPage,
+    TableResult,
+)
+from mcp_memory.pagination import CursorStore, ResultSet
+from mcp_memory.proctable import (
+    ProcessEntry,
+    get_process_table,
+    is_current,
+    load_entry,
+)
+from mcp_memory.snapshot import SnapshotCache
+
+PROCESS_FIELDS = tuple(ProcessInfo.model_fields)
+GROUP_FIELDS = tuple(ProcessGroup.model_fields)
+# Table format omits fields derivable from age_hours unless requested
+TABLE_DEFAULT_FIELDS = tuple(
+    f for f in PROCESS_FIELDS if f not in ("create_time", "age_formatted", "started_at")
+)
+DEFAULT_CMDLINE_MAX = 200
+# Command lines are kept this long in shared snapshots, then cut per request
+SNAPSHOT_CMDLINE_MAX = 4096
+_TIME_FIELDS = frozenset({"create_time", "age_hours", "age_formatted", "started_at"})
+
+# Sharded scanning: number of workers (1 = serial) and "thread" or "process".
+# Process workers start from bare PIDs with no previous CPU times, so scans
+# that need cpu_percent always use threads.
+SCAN_WORKERS = int(os.environ.get("MCP_MEMORY_SCAN_WORKERS", "1"))
+SCAN_MODE = os.environ.get("MCP_MEMORY_SCAN_MODE", "thread")
+
+# One pool per mode with its worker count, replaced when SCAN_WORKERS changes
+_executors: dict[str, tuple[int, Executor]] = {}
+_executors_lock = threading.Lock()
+# Set once a process pool has started its forkserver and workers
+_process_pool_started = False
+
+# Result sets retained for cursor pagination
+_cursors = CursorStore()
 
 
 def _format_age(hours: float) -> str:
@@ -30,61 +80,410 @@ def _format_timestamp(ts: float) -> str:
     return dt.strftime("%b %d %H:%M")
 
 
-def _get_process_info(proc: psutil.Process) -> ProcessInfo | None:
-    """Extract process info, returning None if process disappears."""
+def _iter_processes() -> Iterator[tuple[psutil.Process, ProcessEntry | None]]:
+    """
+    Yield live processes, with cached static attributes when available.
+
+    Uses the live process table if enabled, otherwise psutil.process_iter().
+    Leaves out this server's own process-pool helpers.
+    """
+    pool_pids = _pool_pids()
+    table = get_process_table()
+    if table is None:
+        for proc in psutil.process_iter():
+            if proc.pid not in pool_pids:
+                yield proc, None
+    else:
+        for entry in table.snapshot():
+            if entry.pid not in pool_pids:
+                yield entry.process, entry
+
+
+def _pool_pids() -> set[int]:
+    """
+    PIDs of the process pool's forkserver and workers.
+
+    These are descendants of this server, looked up only once a process pool
+    has been started, so thread and serial scans skip the lookup.
+    """
+    if not _process_pool_started:
+        return set()
+    try:
+        return {child.pid for child in psutil.Process().children(recursive=True)}
+    except psutil.Error:
+        return set()
+
+
+def _collect_process(
+    proc: psutil.Process,
+    entry: ProcessEntry | None,
+    fields: frozenset[str],
+    cmdline_max: int,
+) -> dict | None:
+    """
+    Collect ProcessInfo fields, returning None if process disappears.
+
+    Only the attributes needed for `fields` are read. Static attributes (name,
+    owner, start time, command line) are taken from the process table entry
+    when given instead of being re-read from /proc, after checking that the
+    PID has not been reused since the entry was cached. The pseudo-field
+    "group_keys" adds the process's cached GroupKeys.
+    """
+    if entry is not None and not is_current(entry):
+        table = get_process_table()
+        entry = table.reload(proc.pid) if table else load_entry(proc.pid)
+        if entry is None:
+            return None
+        proc = entry.process
+
     try:
         with proc.oneshot():
-            create_time = proc.create_time()
-            age_hours = (time.time() - create_time) / 3600
-            cmdline = proc.cmdline()
-            cmdline_str = " ".join(cmdline)[:200] if cmdline else ""
-
-            return ProcessInfo(
-                pid=proc.pid,
-                name=proc.name(),
-                username=proc.username(),
-                memory_mb=round(proc.memory_info().rss / (1024**2), 2),
-                memory_percent=round(proc.memory_percent(), 2),
-                cpu_percent=round(proc.cpu_percent(interval=0.0), 1),
-                status=proc.status(),
-                create_time=create_time,
-                age_hours=round(age_hours, 2),
-                age_formatted=_format_age(age_hours),
-                started_at=_format_timestamp(create_time),
-                cmdline=cmdline_str,
-            )
+            row: dict = {"pid": proc.pid}
+            if "name" in fields:
+                row["name"] = entry.name if entry else proc.name()
+            if "username" in fields:
+                row["username"] = entry.username if entry else proc.username()
+            if "memory_mb" in fields:
+                row["memory_mb"] = round(proc.memory_info().rss / (1024**2), 2)
+            if "memory_percent" in fields:
+                row["memory_percent"] = round(proc.memory_percent(), 2)
+            if "cpu_percent" in fields:
+                row["cpu_percent"] = round(proc.cpu_percent(interval=0.0), 1)
+            if "status" in fields:
+                row["status"] = proc.status()
+            if not fields.isdisjoint(_TIME_FIELDS):
+                create_time = entry.create_time if entry else proc.create_time()
+                age_hours = (time.time() - create_time) / 3600
+                if "create_time" in fields:
+                    row["create_time"] = create_time
+                if "age_hours" in fields:
+                    row["age_hours"] = round(age_hours, 2)
+                if "age_formatted" in fields:
+                    row["age_formatted"] = _format_age(age_hours)
+                if "started_at" in fields:
+                    row["started_at"] = _format_timestamp(create_time)
+            if "cmdline" in fields:
+                cmdline = entry.cmdline if entry else " ".join(proc.cmdline())
+                row["cmdline"] = cmdline[:cmdline_max]
+            if "group_keys" in fields:
+                row["group_keys"] = group_keys(proc, entry)
+            return row
     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
         return None
 
 
+def _resolve_fields(
+    format: str,
+    fields: list[str] | None,
+    available: tuple[str, ...],
+    default: tuple[str, ...],
+) -> list[str]:
+    """Validate the output columns for a response format."""
+    if format not in ("object", "table"):
+        raise ValueError(f"Invalid format: {format}. Use 'object' or 'table'.")
+    if format == "object" and fields is not None:
+        raise ValueError("fields requires format='table'; objects have every field")
+    if format == "object" or fields is None:
+        return list(available if format == "object" else default)
+    unknown = [f for f in fields if f not in available]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Valid: {', '.join(available)}"
+        )
+    return list(dict.fromkeys(fields))
+
+
+def _to_table(rows: Iterable[dict], columns: list[str]) -> TableResult:
+    """Project rows onto columns."""
+    return TableResult(
+        columns=columns,
+        rows=[[row[c] for c in columns] for row in rows],
+    )
+
+
+def _get_executor(mode: str, workers: int) -> Executor:
+    """
+    Return the shared worker pool for a mode, sized to `workers`.
+
+    A pool of another size is shut down and replaced, so changing the worker
+    count does not leave idle pools behind. Callers hold _executors_lock
+    until their work is submitted.
+    """
+    global _process_pool_started
+    current = _executors.get(mode)
+    if current is not None:
+        size, executor = current
+        if size == workers:
+            return executor
+        # Submitted work still completes; idle workers exit
+        executor.shutdown(wait=False)
+    if mode == "process":
+        executor = ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("forkserver")
+        )
+        _process_pool_started = True
+    else:
+        executor = ThreadPoolExecutor(workers, thread_name_prefix="mcp-memory-scan")
+    _executors[mode] = (workers, executor)
+    return executor
+
+
+def _run_shard(
+    shard: Iterable,
+    fn: Callable,
+    fields: frozenset[str],
+    cmdline_max: int,
+    *args,
+) -> Any:
+    """Collect rows for one shard and apply a shard function to them."""
+    return fn(_shard_rows(shard, fields, cmdline_max), *args)
+
+
+def _scan(fn: Callable, fields: frozenset[str], cmdline_max: int, *args) -> list:
+    """
+    Scan the live processes and return per-shard partial results.
+
+    With SCAN_WORKERS > 1 the process list is striped across a worker pool;
+    callers merge the partials with a reduction that does not depend on how
+    processes were sharded.
+    """
+    items: list = list(_iter_processes())
+    workers = min(SCAN_WORKERS, len(items))
+    if workers <= 1:
+        return [_run_shard(items, fn, fields, cmdline_max, *args)]
+
+    # cpu_percent needs the long-lived Process objects from _iter_processes
+    mode = "thread" if "cpu_percent" in fields else SCAN_MODE
+    if mode == "process":
+        # psutil.Process objects cannot be pickled
+        items = [proc.pid for proc, _ in items]
+    shards = [items[i::workers] for i in range(workers)]
+    with _executors_lock:
+        # map() submits every shard before returning, so a concurrent resize
+        # cannot shut the pool down under it
+        results = _get_executor(mode, SCAN_WORKERS).map(
+            _run_shard,
+            shards,
+            repeat(fn),
+            repeat(fields),
+            repeat(cmdline_max),
+            *(repeat(arg) for arg in args),
+        )
+    return list(results)
+
+
+def _list_rows(rows: Iterable[dict]) -> list[dict]:
+    """Shard function keeping every row."""
+    return list(rows)
+
+
+def _scan_snapshot() -> list[dict]:
+    """Collect every field and the grouping keys of every process for snapshots."""
+    fields = frozenset(PROCESS_FIELDS) | {"group_keys"}
+    partials = _scan(_list_rows, fields, SNAPSHOT_CMDLINE_MAX)
+    return [row for partial in partials for row in partial]
+
+
+_snapshot: SnapshotCache[list[dict]] = SnapshotCache(_scan_snapshot)
+
+
+def _map_shards(fn: Callable, fields: frozenset[str], cmdline_max: int, *args) -> list:
+    """
+    Apply a shard function to the current processes' rows.
+
+    Reuses the shared snapshot when SNAPSHOT_TTL is set, otherwise scans
+    collecting only `fields`.
+    """
+    if snapshot.SNAPSHOT_TTL <= 0:
+        return _scan(fn, fields, cmdline_max, *args)
+
+    rows: Iterable[dict] = _snapshot.get(snapshot.SNAPSHOT_TTL)
+    if "cmdline" in fields and cmdline_max < SNAPSHOT_CMDLINE_MAX:
+        rows = ({**row, "cmdline": row["cmdline"][:cmdline_max]} for row in rows)
+    return [fn(rows, *args)]
+
+
+def _shard_rows(
+    shard: Iterable,
+    fields: frozenset[str],
+    cmdline_max: int,
+) -> Iterator[dict]:
+    """Yield collected rows for a shard of (process, entry) pairs or bare PIDs."""
+    for item in shard:
+        if isinstance(item, int):
+            try:
+                proc = psutil.Process(item)
+                row = _collect_process(proc, None, fields, cmdline_max)
+            except psutil.Error:
+                continue
+        else:
+            row = _collect_process(*item, fields, cmdline_max)
+        if row is not None:
+            yield row
+
+
+def _by_memory(row: dict) -> tuple[float, int]:
+    """Sort key: memory descending, ties broken by lowest PID first."""
+    return row["memory_mb"], -row["pid"]
+
+
+def _by_cpu(row: dict) -> tuple[float, int]:
+    """Sort key: CPU descending, ties broken by lowest PID first."""
+    return row["cpu_percent"], -row["pid"]
+
+
+def _descending(key: Callable[[dict], tuple]) -> Callable[[dict], tuple]:
+    """Invert a numeric sort key so ascending heap order is descending key order."""
+    return lambda row: tuple(-v for v in key(row))
+
+
+def _paginate(
+    cursor: str | None,
+    page_size: int | None,
+    format: str,
+    columns: list[str],
+    key: Callable[[dict], tuple],
+    scan: Callable[[], list[dict]],
+    item: type[ProcessInfo] | type[ProcessGroup] = ProcessInfo,
+) -> ProcessPage | ProcessGroupPage:
+    """
+    Serve one page of rows in ascending key order.
+
+    The first page runs scan() and retains its rows; a cursor continues that
+    result set, whose format and columns take precedence over the request's.
+    """
+
+    def build() -> ResultSet:
+        return ResultSet(
+            scan(), key, {"format": format, "columns": columns, "item": item}
+        )
+
+    result_set, rows, next_cursor = _cursors.page(cursor, page_size, build)
+    meta = result_set.meta
+    if meta["item"] is not item:
+        raise ValueError("Cursor belongs to a different listing")
+    page = ProcessGroupPage if item is ProcessGroup else ProcessPage
+    return page(
+        items=(
+            _to_table(rows, meta["columns"])
+            if meta["format"] == "table"
+            else [item(**row) for row in rows]
+        ),
+        total=result_set.total,
+        next_cursor=next_cursor,
+    )
+
+
+def _top_shard(rows: Iterable[dict], n: int, key: Callable) -> list[dict]:
+    """Top N processes of one shard."""
+    return heapq.nlargest(n, rows, key=key)
+
+
+def _stale_shard(
+    rows: Iterable[dict],
+    min_age_hours: float,
+    state_set: set[str],
+    pattern: re.Pattern | None,
+    min_memory_mb: float,
+) -> list[dict]:
+    """Processes of one shard matching the staleness criteria."""
+    matches: list[dict] = []
+    for row in rows:
+        # Check age
+        if row["age_hours"] < min_age_hours:
+            continue
+
+        # Check state
+        if row["status"].lower() not in state_set:
+            continue
+
+        # Check memory
+        if row["memory_mb"] < min_memory_mb:
+            continue
+
+        # Check name pattern
+        if pattern and not pattern.search(row["name"]):
+            continue
+
+        matches.append(row)
+    return matches
+
+
+def _group_shard(
+    rows: Iterable[dict],
+    group_by: str = "name",
+    pattern: re.Pattern | None = None,
+) -> dict[str, list[tuple[int, float, float]]]:
+    """Per-key (pid, memory_mb, memory_percent) members of one shard."""
+    groups: dict[str, list[tuple[int, float, float]]] = {}
+    for row in rows:
+        if group_by == "name":
+            key = row["name"]
+        else:
+            key = row["group_keys"].get(group_by, pattern)
+            if key is None:
+                continue
+        groups.setdefault(key, []).append(
+            (row["pid"], row["memory_mb"], row["memory_percent"])
+        )
+    return groups
+
+
 def list_top_processes(
     n: int = 10,
     sort_by: str = "memory",
-) -> list[ProcessInfo]:
+    format: str = "object",
+    fields: list[str] | None = None,
+    cmdline_max: int = DEFAULT_CMDLINE_MAX,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> list[ProcessInfo] | TableResult | ProcessPage:
     """
     List top N memory-consuming processes.
 
     Args:
         n: Number of processes to return (default 10, max 100)
         sort_by: Sort criterion - "memory" (default) or "cpu"
+        format: "object" (default) for ProcessInfo list, "table" for TableResult
+        fields: Columns to collect and return; table format only
+                (default: all but create_time, age_formatted, started_at)
+        cmdline_max: Maximum command line length (default 200)
+        page_size: Page through every process, this many per page (max 100);
+                   n is then ignored
+        cursor: next_cursor of a previous page; continues its result set and
+                ignores the other arguments
 
     Returns:
-        List of ProcessInfo sorted by the specified criterion
+        List of ProcessInfo or TableResult sorted by the specified criterion,
+        or a ProcessPage when paginating
     """
     n = min(max(1, n), 100)
+    cmdline_max = max(0, cmdline_max)
+    columns = _resolve_fields(format, fields, PROCESS_FIELDS, TABLE_DEFAULT_FIELDS)
+    key = _by_cpu if sort_by == "cpu" else _by_memory
+    collect = frozenset(columns) | {"cpu_percent" if sort_by == "cpu" else "memory_mb"}
+
+    if page_size is not None or cursor is not None:
+        return _paginate(
+            cursor,
+            page_size,
+            format,
+            columns,
+            _descending(key),
+            lambda: [
+                row
+                for part in _map_shards(_list_rows, collect, cmdline_max)
+                for row in part
+            ],
+        )
 
-    processes: list[ProcessInfo] = []
-    for proc in psutil.process_iter():
-        info = _get_process_info(proc)
-        if info is not None:
-            processes.append(info)
-
-    if sort_by == "cpu":
-        processes.sort(key=lambda p: p.cpu_percent, reverse=True)
-    else:
-        processes.sort(key=lambda p: p.memory_mb, reverse=True)
+    # Merge the per-shard heaps
+    partials = _map_shards(_top_shard, collect, cmdline_max, n, key)
+    rows = heapq.nlargest(n, (r for partial in partials for r in partial), key=key)
 
-    return processes[:n]
+    if format == "table":
+        return _to_table(rows, columns)
+    return [ProcessInfo(**row) for row in rows]
 
 
 def find_stale_processes(
@@ -92,7 +491,12 @@ def find_stale_processes(
     states: list[str] | None = None,
     name_pattern: str | None = None,
     min_memory_mb: float = 0,
-) -> list[ProcessInfo]:
+    format: str = "object",
+    fields: list[str] | None = None,
+    cmdline_max: int = DEFAULT_CMDLINE_MAX,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> list[ProcessInfo] | TableResult | ProcessPage:
     """
     Find potentially stale processes based on various criteria.
 
@@ -102,10 +506,23 @@ def find_stale_processes(
                 Valid states: sleeping, zombie, stopped, idle, running, disk-sleep
         name_pattern: Regex pattern to match process names (e.g., "ghc|cabal")
         min_memory_mb: Minimum memory usage in MB (default 0)
+        format: "object" (default) for ProcessInfo list, "table" for TableResult
+        fields: Columns to collect and return; table format only
+                (default: all but create_time, age_formatted, started_at)
+        cmdline_max: Maximum command line length (default 200)
+        page_size: Return matches this many per page (max 100) instead of
+                   all at once
+        cursor: next_cursor of a previous page; continues its result set and
+                ignores the other arguments
 
     Returns:
-        List of ProcessInfo matching the criteria, sorted by memory usage
+        List of ProcessInfo or TableResult matching the criteria,
+        sorted by memory usage, or a ProcessPage when paginating
     """
+    cmdline_max = max(0, cmdline_max)
+    columns = _resolve_fields(format, fields, PROCESS_FIELDS, TABLE_DEFAULT_FIELDS)
+    collect = frozenset(columns) | {"age_hours", "status", "memory_mb", "name"}
+
     if states is None:
         states = ["sleeping"]
 
@@ -115,80 +532,119 @@ def find_stale_processes(
     # Compile regex if provided
     pattern = re.compile(name_pattern, re.IGNORECASE) if name_pattern else None
 
-    matches: list[ProcessInfo] = []
-    for proc in psutil.process_iter():
-        info = _get_process_info(proc)
-        if info is None:
-            continue
-
-        # Check age
-        if info.age_hours < min_age_hours:
-            continue
-
-        # Check state
-        if info.status.lower() not in state_set:
-            continue
-
-        # Check memory
-        if info.memory_mb < min_memory_mb:
-            continue
+    def scan() -> list[dict]:
+        partials = _map_shards(
+            _stale_shard,
+            collect,
+            cmdline_max,
+            min_age_hours,
+            state_set,
+            pattern,
+            min_memory_mb,
+        )
+        return [r for partial in partials for r in partial]
 
-        # Check name pattern
-        if pattern and not pattern.search(info.name):
-            continue
+    if page_size is not None or cursor is not None:
+        return _paginate(
+            cursor, page_size, format, columns, _descending(_by_memory), scan
+        )
 
-        matches.append(info)
+    matches = scan()
 
     # Sort by memory usage descending
-    matches.sort(key=lambda p: p.memory_mb, reverse=True)
-    return matches
+    matches.sort(key=_by_memory, reverse=True)
+
+    if format == "table":
+        return _to_table(matches, columns)
+    return [ProcessInfo(**row) for row in matches]
 
 
 def list_process_groups(
     n: int = 10,
     min_count: int = 1,
-) -> list[ProcessGroup]:
+    format: str = "object",
+    fields: list[str] | None = None,
+    group_by: str = "name",
+    pattern: str | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> list[ProcessGroup] | TableResult | ProcessGroupPage:
     """
-    List processes grouped by name with aggregated stats.
+    List processes grouped by name or another key, with aggregated stats.
 
     Args:
         n: Number of groups to return (default 10, max 50)
         min_count: Minimum number of instances to include (default 1)
+        format: "object" (default) for ProcessGroup list, "table" for TableResult
+        fields: Columns to return; table format only (default: all)
+        group_by: "name" (default), "exe", "cmdline" (interpreter plus
+                  script or main class), "user", "container" or "regex"
+        pattern: With group_by="regex", regex searched in the full command
+                 line; the key is its first group, or the whole match.
+                 Processes that do not match are left out.
+        page_size: Page through every group, this many per page (max 100);
+                   n is then ignored
+        cursor: next_cursor of a previous page; continues its result set and
+                ignores the other arguments
 
     Returns:
-        List of ProcessGroup sorted by total memory usage descending
+        List of ProcessGroup or TableResult sorted by total memory usage
+        descending, or a ProcessGroupPage when paginating
     """
     n = min(max(1, n), 50)
     min_count = max(1, min_count)
+    columns = _resolve_fields(format, fields, GROUP_FIELDS, GROUP_FIELDS)
+    if group_by not in GROUP_BY:
+        raise ValueError(
+            f"Invalid group_by: {group_by}. Valid: {', '.join(GROUP_BY)}"
+        )
+    compiled = None
+    if group_by == "regex":
+        if not pattern:
+            raise ValueError("group_by='regex' requires a pattern")
+        try:
+            compiled = re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern: {e}") from e
+
+    collect = frozenset({"memory_mb", "memory_percent"})
+    collect |= {"name"} if group_by == "name" else {"group_keys"}
+
+    def scan() -> list[dict]:
+        groups: dict[str, list[tuple[int, float, float]]] = {}
+        for partial in _map_shards(_group_shard, collect, 0, group_by, compiled):
+            for name, members in partial.items():
+                groups.setdefault(name, []).extend(members)
+
+        rows = []
+        for name, members in groups.items():
+            if len(members) < min_count:
+                continue
+            # Sum in PID order so totals do not depend on sharding
+            members.sort()
+            rows.append(
+                {
+                    "name": name,
+                    "count": len(members),
+                    "total_memory_mb": round(sum(m[1] for m in members), 2),
+                    "total_memory_percent": round(sum(m[2] for m in members), 2),
+                    "pids": [m[0] for m in members],
+                }
+            )
+        return rows
 
-    groups: dict[str, dict] = {}
-    for proc in psutil.process_iter():
-        info = _get_process_info(proc)
-        if info is None:
-            continue
+    def by_total(group: dict) -> tuple[float, str]:
+        return -group["total_memory_mb"], group["name"]
 
-        name = info.name
-        if name not in groups:
-            groups[name] = {
-                "pids": [],
-                "total_memory_mb": 0.0,
-                "total_memory_percent": 0.0,
-            }
-        groups[name]["pids"].append(info.pid)
-        groups[name]["total_memory_mb"] += info.memory_mb
-        groups[name]["total_memory_percent"] += info.memory_percent
-
-    result = [
-        ProcessGroup(
-            name=name,
-            count=len(data["pids"]),
-            total_memory_mb=round(data["total_memory_mb"], 2),
-            total_memory_percent=round(data["total_memory_percent"], 2),
-            pids=data["pids"],
+    if page_size is not None or cursor is not None:
+        return _paginate(
+            cursor, page_size, format, columns, by_total, scan, ProcessGroup
         )
-        for name, data in groups.items()
-        if len(data["pids"]) >= min_count
-    ]
 
-    result.sort(key=lambda g: g.total_memory_mb, reverse=True)
-    return result[:n]
+    rows = scan()
+    rows.sort(key=by_total)
+    rows = rows[:n]
+
+    if format == "table":
+        return _to_table(rows, columns)
+    return [ProcessGroup(**row) for row in rows]
@@ -0,0 +1,196 @@
+"""Per-process memory map inspection tool."""
+
+import heapq
+import re
+
+from mcp_memory.models import MappingGroup, MemoryMapping, ProcessMemoryMap
+
+# Filesystem root, overridable in tests
+PROC_ROOT = "/proc"
+
+CATEGORIES = ("heap", "stack", "anon", "shmem", "file", "special")
+SORT_KEYS = {"rss": 2, "pss": 3, "swap": 4}
+
+# Bytes of smaps read at a time
+CHUNK_SIZE = 1 << 20
+
+# One mapping: a header line starting with its lowercase hex address, then
+# field lines starting with a capital, of which Size, Rss, Pss and Swap are
+# kept. Skipped lines cannot start with a digit, so a match never runs into
+# the next mapping.
+_MAPPING = re.compile(
+    rb"^([0-9a-f][^\n]*)\n"
+    rb"(?:[A-Z][^\n]*\n)*?Size: +(\d+) kB\n"
+    rb"(?:[A-Z][^\n]*\n)*?Rss: +(\d+) kB\n"
+    rb"(?:[A-Z][^\n]*\n)*?Pss: +(\d+) kB\n"
+    rb"(?:[A-Z][^\n]*\n)*?Swap: +(\d+) kB\n",
+    re.MULTILINE,
+)
+_SHMEM_PREFIXES = ("/dev/shm/", "/SYSV", "/memfd:", "/dev/zero", "[anon_shmem")
+
+
+def _categorize(perms: str, path: str) -> str:
+    """Classify a mapping by its permissions and backing path."""
+    if not path:
+        # Anonymous shared mappings are backed by shmem
+        return "shmem" if perms[3:4] == "s" else "anon"
+    if path == "[heap]":
+        return "heap"
+    if path.startswith("[stack"):
+        return "stack"
+    if path.startswith(_SHMEM_PREFIXES):
+        return "shmem"
+    if path.startswith("[anon"):
+        return "anon"
+    if path.startswith("["):
+        return "special"
+    return "file"
+
+
+def _parse_header(header: bytes) -> tuple[str, str, str]:
+    """Split a smaps header line into (address, perms, path)."""
+    fields = header.split(maxsplit=5)
+    path = fields[5].rstrip().decode(errors="replace") if len(fields) > 5 else ""
+    return fields[0].decode(), fields[1].decode(), path
+
+
+def _mb(kb: int) -> float:
+    """Convert kB to MB rounded for display."""
+    return round(kb / 1024, 2)
+
+
+def _group(key: str, category: str, totals: list[int]) -> MappingGroup:
+    """Build a MappingGroup from [count, size, rss, pss, swap] totals."""
+    count, size, rss, pss, swap = totals
+    return MappingGroup(
+        key=key,
+        category=category,
+        count=count,
+        size_mb=_mb(size),
+        rss_mb=_mb(rss),
+        pss_mb=_mb(pss),
+        swap_mb=_mb(swap),
+    )
+
+
+def _read_name(pid: int) -> str:
+    """Read the process name from /proc/[pid]/comm."""
+    try:
+        with open(f"{PROC_ROOT}/{pid}/comm") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def inspect_process_memory(
+    pid: int,
+    n: int = 10,
+    sort_by: str = "rss",
+) -> ProcessMemoryMap:
+    """
+    Break down a process's memory by mapping category and backing path.
+
+    Stream-parses /proc/[pid]/smaps in chunks, matching whole mappings with
+    one regex rather than testing every line in Python, and keeps only
+    running totals and a bounded heap of the largest mappings, so memory use
+    is independent of the number of mappings.
+
+    Args:
+        pid: Process ID to inspect
+        n: Number of top paths and mappings to return (default 10, max 100)
+        sort_by: Ranking criterion - "rss" (default), "pss" or "swap"
+
+    Returns:
+        ProcessMemoryMap with per-category totals, top paths and top mappings
+
+    Raises:
+        ValueError: If the process does not exist or cannot be inspected
+    """
+    n = min(max(1, n), 100)
+    if sort_by not in SORT_KEYS:
+        sort_by = "rss"
+    sort_index = SORT_KEYS[sort_by]
+
+    # Per-key running totals: [count, size_kb, rss_kb, pss_kb, swap_kb]
+    categories = {c: [0, 0, 0, 0, 0] for c in CATEGORIES}
+    paths: dict[str, list[int]] = {}
+    path_categories: dict[str, str] = {}
+    # Min-heap of (sort value, seq, header, category, size, rss, pss, swap)
+    top: list[tuple] = []
+    mapping_count = 0
+
+    def add(header: bytes, size: int, rss: int, pss: int, swap: int) -> None:
+        nonlocal mapping_count
+        _, perms, path = _parse_header(header)
+        category = _categorize(perms, path)
+        key = path or "[anon]"
+        if key not in paths:
+            paths[key] = [0, 0, 0, 0, 0]
+            path_categories[key] = category
+
+        values = (1, size, rss, pss, swap)
+        for totals in (categories[category], paths[key]):
+            for i, v in enumerate(values):
+                totals[i] += v
+
+        entry = (values[sort_index], mapping_count, header, category, *values[1:])
+        if len(top) < n:
+            heapq.heappush(top, entry)
+        elif entry[0] > top[0][0]:
+            heapq.heapreplace(top, entry)
+        mapping_count += 1
+
+    try:
+        with open(f"{PROC_ROOT}/{pid}/smaps", "rb") as f:
+            # Unparsed tail: the start of a mapping cut off by the chunk end
+            buffer = b""
+            while chunk := f.read(CHUNK_SIZE):
+                buffer += chunk
+                end = 0
+                for match in _MAPPING.finditer(buffer):
+                    header, size, rss, pss, swap = match.groups()
+                    add(header, int(size), int(rss), int(pss), int(swap))
+                    end = match.end()
+                buffer = buffer[end:]
+    except FileNotFoundError:
+        raise ValueError(f"PID {pid} does not exist") from None
+    except PermissionError:
+        raise ValueError(f"Access denied to PID {pid}") from None
+    except OSError:
+        # The process exited while its smaps was being read (ESRCH and kin)
+        raise ValueError(f"PID {pid} exited while being inspected") from None
+
+    top_mappings: list[MemoryMapping] = []
+    for _, _, raw, category, m_size, m_rss, m_pss, m_swap in sorted(top, reverse=True):
+        address, perms, path = _parse_header(raw)
+        top_mappings.append(
+            MemoryMapping(
+                address=address,
+                perms=perms,
+                path=path,
+                category=category,
+                size_mb=_mb(m_size),
+                rss_mb=_mb(m_rss),
+                pss_mb=_mb(m_pss),
+                swap_mb=_mb(m_swap),
+            )
+        )
+
+    totals = [sum(t[i] for t in categories.values()) for i in range(5)]
+    top_paths = heapq.nlargest(n, paths.items(), key=lambda item: item[1][sort_index])
+
+    return ProcessMemoryMap(
+        pid=pid,
+        name=_read_name(pid),
+        mapping_count=mapping_count,
+        rss_mb=_mb(totals[2]),
+        pss_mb=_mb(totals[3]),
+        swap_mb=_mb(totals[4]),
+        categories=sorted(
+            (_group(c, c, t) for c, t in categories.items() if t[0] > 0),
+            key=lambda g: getattr(g, f"{sort_by}_mb"),
+            reverse=True,
+        ),
+        top_paths=[_group(path, path_categories[path], t) for path, t in top_paths],
+        top_mappings=top_mappings,
+    )
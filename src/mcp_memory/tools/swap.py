@@ -0,0 +1,226 @@
+"""Per-process swap attribution tool."""
+
+import heapq
+import os
+import pwd
+from functools import lru_cache
+
+import psutil
+
+from mcp_memory import snapshot
+from mcp_memory.models import (
+    SwapGroup,
+    SwappedProcess,
+    SwapReport,
+    ZramDevice,
+    ZswapInfo,
+)
+from mcp_memory.snapshot import SnapshotCache
+
+# Filesystem roots, overridable in tests
+PROC_ROOT = "/proc"
+SYS_ROOT = "/sys"
+
+
+@lru_cache(maxsize=1024)
+def _username(uid: int) -> str:
+    """Resolve a UID to a username, falling back to the numeric UID."""
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+def _status_field(data: bytes, key: bytes) -> bytes | None:
+    """Return the raw value of a `Key:` line in a /proc/[pid]/status blob."""
+    start = data.find(b"\n" + key + b":")
+    if start == -1:
+        return None
+    start += len(key) + 2
+    end = data.find(b"\n", start)
+    return data[start:end if end != -1 else None].strip()
+
+
+def _read_swapped_process(pid: int) -> SwappedProcess | None:
+    """
+    Read swap usage for one PID from /proc/[pid]/status.
+
+    Returns None for processes with no swapped-out memory (including kernel
+    threads, which have no VmSwap line) or that vanish while being read,
+    without parsing the rest of the file.
+    """
+    try:
+        with open(f"{PROC_ROOT}/{pid}/status", "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    swap = _status_field(data, b"VmSwap")
+    if swap is None:
+        return None
+    swap_kb = int(swap.split()[0])
+    if swap_kb == 0:
+        return None
+
+    # The Name line comes first, so there is no preceding newline to match
+    name = data[6 : data.find(b"\n")].decode(errors="replace").strip()
+    uid = _status_field(data, b"Uid")
+    rss = _status_field(data, b"VmRSS")
+
+    return SwappedProcess(
+        pid=pid,
+        name=name,
+        username=_username(int(uid.split()[0])) if uid else "?",
+        swap_mb=round(swap_kb / 1024, 2),
+        rss_mb=round(int(rss.split()[0]) / 1024, 2) if rss else 0.0,
+    )
+
+
+def _iter_swapped_processes():
+    """Yield SwappedProcess for every PID with non-zero VmSwap."""
+    try:
+        entries = os.listdir(PROC_ROOT)
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        info = _read_swapped_process(int(entry))
+        if info is not None:
+            yield info
+
+
+_snapshot: SnapshotCache[list[SwappedProcess]] = SnapshotCache(
+    lambda: list(_iter_swapped_processes())
+)
+
+
+def _swapped_processes() -> list[SwappedProcess]:
+    """Swapped processes, from the shared snapshot when SNAPSHOT_TTL is set."""
+    if snapshot.SNAPSHOT_TTL <= 0:
+        return list(_iter_swapped_processes())
+    return _snapshot.get(snapshot.SNAPSHOT_TTL)
+
+
+def _read_meminfo_kb(key: str) -> int | None:
+    """Read a single `Key:  N kB` value from /proc/meminfo."""
+    try:
+        with open(f"{PROC_ROOT}/meminfo") as f:
+            for line in f:
+                if line.startswith(key + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _read_sys(path: str) -> str | None:
+    """Read and strip a sysfs attribute, returning None if unavailable."""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _get_zswap_info() -> ZswapInfo | None:
+    """Return zswap stats, or None if the kernel has no zswap module."""
+    params = f"{SYS_ROOT}/module/zswap/parameters"
+    enabled = _read_sys(f"{params}/enabled")
+    if enabled is None:
+        return None
+
+    pool_kb = _read_meminfo_kb("Zswap")
+    stored_kb = _read_meminfo_kb("Zswapped")
+    return ZswapInfo(
+        enabled=enabled in ("Y", "1"),
+        compressor=_read_sys(f"{params}/compressor"),
+        pool_mb=round(pool_kb / 1024, 2) if pool_kb is not None else None,
+        stored_mb=round(stored_kb / 1024, 2) if stored_kb is not None else None,
+    )
+
+
+def _get_zram_devices() -> list[ZramDevice]:
+    """Return stats for every initialized zram device."""
+    block = f"{SYS_ROOT}/block"
+    try:
+        names = sorted(d for d in os.listdir(block) if d.startswith("zram"))
+    except OSError:
+        return []
+
+    devices: list[ZramDevice] = []
+    for name in names:
+        disksize = _read_sys(f"{block}/{name}/disksize")
+        mm_stat = _read_sys(f"{block}/{name}/mm_stat")
+        if not disksize or not mm_stat or int(disksize) == 0:
+            continue
+        # mm_stat: orig_data_size compr_data_size mem_used_total ...
+        orig, compr, used = (int(v) for v in mm_stat.split()[:3])
+        devices.append(
+            ZramDevice(
+                device=name,
+                disksize_mb=round(int(disksize) / (1024**2), 2),
+                orig_data_mb=round(orig / (1024**2), 2),
+                compr_data_mb=round(compr / (1024**2), 2),
+                mem_used_mb=round(used / (1024**2), 2),
+                compression_ratio=round(orig / compr, 2) if compr else None,
+            )
+        )
+    return devices
+
+
+def list_swapped_processes(
+    n: int = 10,
+    min_swap_mb: float = 0,
+) -> SwapReport:
+    """
+    List processes ranked by swapped-out memory.
+
+    Reads VmSwap from /proc/[pid]/status in a single pass; processes with no
+    swapped-out memory are skipped without further parsing.
+
+    Args:
+        n: Number of processes and groups to return (default 10, max 100)
+        min_swap_mb: Minimum swapped-out memory in MB to include (default 0)
+
+    Returns:
+        SwapReport with top processes, name groups and zswap/zram stats
+    """
+    n = min(max(1, n), 100)
+
+    swapped: list[SwappedProcess] = []
+    groups: dict[str, dict] = {}
+    attributed_mb = 0.0
+    for info in _swapped_processes():
+        attributed_mb += info.swap_mb
+        if info.swap_mb < min_swap_mb:
+            continue
+        swapped.append(info)
+
+        if info.name not in groups:
+            groups[info.name] = {"pids": [], "total_swap_mb": 0.0}
+        groups[info.name]["pids"].append(info.pid)
+        groups[info.name]["total_swap_mb"] += info.swap_mb
+
+    top_groups = heapq.nlargest(
+        n, groups.items(), key=lambda item: item[1]["total_swap_mb"]
+    )
+
+    swap = psutil.swap_memory()
+    return SwapReport(
+        swap_total_mb=round(swap.total / (1024**2), 2),
+        swap_used_mb=round(swap.used / (1024**2), 2),
+        attributed_swap_mb=round(attributed_mb, 2),
+        processes=heapq.nlargest(n, swapped, key=lambda p: p.swap_mb),
+        groups=[
+            SwapGroup(
+                name=name,
+                count=len(data["pids"]),
+                total_swap_mb=round(data["total_swap_mb"], 2),
+                pids=data["pids"],
+            )
+            for name, data in top_groups
+        ],
+        zswap=_get_zswap_info(),
+        zram=_get_zram_devices(),
+    )
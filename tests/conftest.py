@@ -0,0 +1,70 @@
+"""Shared fixtures."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+
+import pytest
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_until_listening(address: tuple[str, int] | str) -> None:
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    deadline = time.monotonic() + 20
+    while True:
+        try:
+            with socket.socket(family) as s:
+                s.settimeout(0.1)
+                s.connect(address)
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+@pytest.fixture
+def start_daemon() -> Iterator[Callable[..., str]]:
+    """
+    Start real mcp-memory daemons as subprocesses.
+
+    Call with extra command-line options; returns the daemon's URL, or the
+    socket path if "--socket" is among the options. Daemons are stopped at
+    teardown.
+    """
+    daemons: list[subprocess.Popen] = []
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    def start(*options: str) -> str:
+        if "--socket" in options:
+            address = options[options.index("--socket") + 1]
+            command = list(options)
+        else:
+            port = _free_port()
+            address = ("127.0.0.1", port)
+            command = ["--transport", "http", "--port", str(port), *options]
+        daemons.append(
+            subprocess.Popen(
+                [sys.executable, "-m", "mcp_memory", *command],
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        )
+        _wait_until_listening(address)
+        if isinstance(address, str):
+            return address
+        return f"http://127.0.0.1:{address[1]}/mcp"
+
+    yield start
+    for daemon in daemons:
+        daemon.terminate()
+        daemon.wait()
@@ -0,0 +1,236 @@
+"""Tests for the multi-host aggregator."""
+
+import asyncio
+import time
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from mcp_memory import aggregator
+from mcp_memory.__main__ import _parse_args
+from mcp_memory.aggregator import Aggregator, parse_peers, register_pool_tools
+from mcp_memory.models import ProcessGroup, ProcessGroupPage, ProcessInfo, TableResult
+from mcp_memory.server import mcp as real_server
+
+
+def _process(pid: int, name: str, memory_mb: float, cpu: float = 0.0) -> dict:
+    return ProcessInfo(
+        pid=pid,
+        name=name,
+        username="user",
+        memory_mb=memory_mb,
+        memory_percent=1.0,
+        cpu_percent=cpu,
+        status="sleeping",
+        create_time=0.0,
+        age_hours=1.0,
+        age_formatted="1h 0m",
+        started_at="2024-01-01 00:00:00",
+        cmdline="",
+    ).model_dump()
+
+
+def _stand_in(
+    processes: list[dict],
+    groups: list[dict],
+    delay: float = 0.0,
+) -> FastMCP:
+    """A peer answering with canned table-format results."""
+    server = FastMCP(name="stand-in")
+
+    def table(rows: list[dict], fields: list[str]) -> TableResult:
+        return TableResult(columns=fields, rows=[[r[f] for f in fields] for r in rows])
+
+    @server.tool()
+    async def list_top_processes(
+        n: int = 10,
+        sort_by: str = "memory",
+        format: str = "object",
+        fields: list[str] | None = None,
+    ) -> TableResult:
+        await asyncio.sleep(delay)
+        key = "cpu_percent" if sort_by == "cpu" else "memory_mb"
+        top = sorted(processes, key=lambda p: -p[key])[:n]
+        return table(top, fields)
+
+    @server.tool()
+    async def list_process_groups(
+        n: int = 10,
+        min_count: int = 1,
+        format: str = "object",
+        fields: list[str] | None = None,
+        group_by: str = "name",
+        page_size: int | None = None,
+        cursor: str | None = None,
+    ) -> ProcessGroupPage:
+        await asyncio.sleep(delay)
+        # Cursors here are "<offset>:<page_size>:<fields>"
+        if cursor is not None:
+            offset, size, names = cursor.split(":")
+            offset, page_size, fields = int(offset), int(size), names.split(",")
+        else:
+            offset = 0
+        end = offset + page_size
+        return ProcessGroupPage(
+            items=table(groups[offset:end], fields),
+            total=len(groups),
+            next_cursor=(
+                f"{end}:{page_size}:{','.join(fields)}" if end < len(groups) else None
+            ),
+        )
+
+    return server
+
+
+def _group(name: str, pids: list[int], total_mb: float) -> dict:
+    return ProcessGroup(
+        name=name,
+        count=len(pids),
+        total_memory_mb=total_mb,
+        total_memory_percent=1.0,
+        pids=pids,
+    ).model_dump()
+
+
+@pytest.fixture
+def pool() -> dict[str, FastMCP]:
+    return {
+        "a": _stand_in(
+            [_process(1, "ghc", 900, cpu=5), _process(2, "bash", 10, cpu=50)],
+            [_group("ghc", [1, 3], 1200.0), _group("bash", [2], 10.0)],
+        ),
+        "b": _stand_in(
+            [_process(1, "cc1plus", 1000), _process(7, "ghc", 500)],
+            [_group("ghc", [7], 500.0), _group("cc1plus", [1], 1000.0)],
+        ),
+    }
+
+
+class TestParsePeers:
+    """Tests for peer configuration parsing."""
+
+    def test_labels_default_to_netloc(self) -> None:
+        peers = parse_peers(["http://build1:8765/mcp", "b2=http://build2:8765/mcp"])
+        assert peers == {
+            "build1:8765": "http://build1:8765/mcp",
+            "b2": "http://build2:8765/mcp",
+        }
+
+    def test_comma_separated(self) -> None:
+        peers = parse_peers(["http://a:1/mcp, http://b:2/mcp,"])
+        assert list(peers) == ["a:1", "b:2"]
+
+    def test_url_with_equals_in_query(self) -> None:
+        peers = parse_peers(["http://a:1/mcp?x=1"])
+        assert peers == {"a:1": "http://a:1/mcp?x=1"}
+
+    def test_duplicate_labels_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Duplicate"):
+            parse_peers(["http://a:1/mcp", "a:1=http://b:2/mcp"])
+
+    def test_cli_options(self) -> None:
+        args = _parse_args(["--peer", "http://a:1/mcp", "--peer-timeout", "2"])
+        assert args.peer == ["http://a:1/mcp"]
+        assert args.peer_timeout == 2.0
+
+
+class TestAggregator:
+    """Tests for merging results across hosts."""
+
+    async def test_merges_top_processes(self, pool) -> None:
+        result = await Aggregator(pool).top_processes(n=3)
+        assert [(p.host, p.pid) for p in result.processes] == [
+            ("b", 1),
+            ("a", 1),
+            ("b", 7),
+        ]
+        assert not result.partial
+        assert [s.host for s in result.peers] == ["a", "b"]
+
+    async def test_sort_by_cpu(self, pool) -> None:
+        result = await Aggregator(pool).top_processes(n=1, sort_by="cpu")
+        assert (result.processes[0].host, result.processes[0].name) == ("a", "bash")
+
+    async def test_sums_groups_across_hosts(self, pool) -> None:
+        result = await Aggregator(pool).process_groups()
+        ghc = result.groups[0]
+        assert ghc.name == "ghc"
+        assert ghc.count == 3
+        assert ghc.total_memory_mb == 1700.0
+        assert ghc.hosts == {"a": [1, 3], "b": [7]}
+        assert [g.name for g in result.groups] == ["ghc", "cc1plus", "bash"]
+
+    async def test_sums_every_group_of_every_host(self) -> None:
+        # Far more groups per host than fit on one page
+        many = [_group(f"job{i}", [i], float(1000 - i)) for i in range(250)]
+        pool = {
+            "a": _stand_in([], many),
+            "b": _stand_in([], many[::-1]),
+        }
+        result = await Aggregator(pool).process_groups(n=50, min_count=2)
+        assert len(result.groups) == 50
+        assert all(g.count == 2 for g in result.groups)
+        assert result.groups[-1].name == "job49"
+        assert not result.partial
+
+    async def test_min_count_applies_to_sum(self, pool) -> None:
+        result = await Aggregator(pool).process_groups(min_count=2)
+        assert [g.name for g in result.groups] == ["ghc"]
+
+    async def test_slow_peer_gives_partial_result(self, pool) -> None:
+        pool["slow"] = _stand_in([_process(9, "huge", 99999)], [], delay=5)
+        start = time.perf_counter()
+        result = await Aggregator(pool, timeout=0.5).top_processes()
+        assert time.perf_counter() - start < 3
+        assert result.partial
+        assert "huge" not in [p.name for p in result.processes]
+        status = {s.host: s for s in result.peers}
+        assert not status["slow"].ok
+        assert "TimeoutError" in status["slow"].error
+        assert status["a"].ok and status["b"].ok
+
+    async def test_unreachable_peer(self, pool) -> None:
+        pool["down"] = "http://127.0.0.1:9/mcp"
+        result = await Aggregator(pool, timeout=2).process_groups()
+        assert result.partial
+        assert [s.host for s in result.peers if not s.ok] == ["down"]
+        assert result.groups
+
+    async def test_includes_local_host(self) -> None:
+        aggregator = Aggregator({"peer": real_server}, local="here")
+        result = await aggregator.top_processes(n=5)
+        assert not result.partial
+        assert {p.host for p in result.processes} <= {"here", "peer"}
+        assert "here" in {s.host for s in result.peers}
+
+    def test_peer_with_local_label_rejected(self, pool) -> None:
+        with pytest.raises(ValueError, match="this host's label"):
+            Aggregator(pool, local="a")
+
+    async def test_pool_tools(self, pool) -> None:
+        server = FastMCP(name="aggregator")
+        register_pool_tools(server, Aggregator(pool))
+        async with Client(server) as client:
+            result = await client.call_tool("list_pool_top_processes", {"n": 2})
+        assert [p["host"] for p in result.structured_content["processes"]] == [
+            "b",
+            "a",
+        ]
+
+
+async def test_local_instances_over_http(start_daemon, monkeypatch) -> None:
+    """Fan out to real mcp-memory instances running with default settings."""
+    # Many pages per host, far beyond the default rate limit's burst
+    monkeypatch.setattr(aggregator, "GROUP_PAGE_SIZE", 1)
+    urls = [start_daemon(), start_daemon()]
+    pool = Aggregator(parse_peers(urls), timeout=30)
+    top = await pool.top_processes(n=5)
+    groups = await pool.process_groups(n=5)
+
+    hosts = {url.removeprefix("http://").removesuffix("/mcp") for url in urls}
+    assert not top.partial
+    assert {p.host for p in top.processes} <= hosts
+    assert len(top.processes) == 5
+    assert not groups.partial, groups.peers
+    # Both instances see the same processes, so groups span both
+    assert set(groups.groups[0].hosts) == hosts
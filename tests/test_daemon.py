@@ -0,0 +1,266 @@
+"""Tests for the shared daemon mode."""
+
+import asyncio
+import os
+import stat
+import threading
+import time
+
+import httpx2
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.client.transports import StreamableHttpTransport
+
+from mcp_memory import snapshot
+from mcp_memory.__main__ import _parse_args
+from mcp_memory.daemon import ConcurrencyLimitMiddleware, configure_shared
+from mcp_memory.server import mcp
+from mcp_memory.snapshot import SnapshotCache
+from mcp_memory.tools import processes, swap
+
+
+def _slow_server() -> FastMCP:
+    server = FastMCP(name="test")
+
+    @server.tool()
+    async def slow() -> str:
+        await asyncio.sleep(0.2)
+        return "done"
+
+    return server
+
+
+class TestSnapshotCache:
+    """Tests for SnapshotCache."""
+
+    def test_reuses_fresh_snapshot(self) -> None:
+        calls = []
+        cache = SnapshotCache(lambda: calls.append(1) or len(calls))
+        assert cache.get(60) == 1
+        assert cache.get(60) == 1
+        assert len(calls) == 1
+
+    def test_rescans_stale_snapshot(self) -> None:
+        calls = []
+        cache = SnapshotCache(lambda: calls.append(1) or len(calls))
+        cache.get(0)
+        time.sleep(0.01)
+        assert cache.get(0) == 2
+
+    def test_invalidate(self) -> None:
+        calls = []
+        cache = SnapshotCache(lambda: calls.append(1) or len(calls))
+        cache.get(60)
+        cache.invalidate()
+        assert cache.get(60) == 2
+
+    def test_single_flight(self) -> None:
+        calls = []
+
+        def scan() -> int:
+            calls.append(1)
+            time.sleep(0.1)
+            return len(calls)
+
+        cache = SnapshotCache(scan)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get(60)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [1] * 5
+        assert len(calls) == 1
+
+
+class TestSharedSnapshots:
+    """Tests for tools reading from shared snapshots."""
+
+    @pytest.fixture
+    def shared(self, monkeypatch):
+        monkeypatch.setattr(snapshot, "SNAPSHOT_TTL", 60.0)
+        scans = []
+
+        def scan() -> list[dict]:
+            scans.append(1)
+            return processes._scan_snapshot()
+
+        monkeypatch.setattr(processes, "_snapshot", SnapshotCache(scan))
+        return scans
+
+    def test_tools_share_one_scan(self, shared) -> None:
+        processes.list_top_processes(n=5)
+        processes.list_top_processes(n=5, sort_by="cpu", format="table")
+        processes.list_process_groups(n=5)
+        processes.find_stale_processes(min_age_hours=0)
+        assert len(shared) == 1
+
+    def test_matches_direct_scan(self, shared) -> None:
+        result = processes.list_process_groups(n=50)
+        assert sum(g.count for g in result) > 0
+        for group in result:
+            assert group.pids == sorted(group.pids)
+
+    def test_cmdline_cut_per_request(self, shared) -> None:
+        full = processes.list_top_processes(n=20, cmdline_max=4096)
+        cut = processes.list_top_processes(n=20, cmdline_max=3)
+        assert [p.cmdline[:3] for p in full] == [p.cmdline for p in cut]
+
+    def test_swap_shares_scan(self, monkeypatch) -> None:
+        monkeypatch.setattr(snapshot, "SNAPSHOT_TTL", 60.0)
+        scans = []
+        monkeypatch.setattr(
+            swap, "_snapshot", SnapshotCache(lambda: scans.append(1) or [])
+        )
+        swap.list_swapped_processes()
+        swap.list_swapped_processes(n=3)
+        assert len(scans) == 1
+
+
+class TestLimits:
+    """Tests for per-client rate and concurrency limits."""
+
+    async def test_concurrency_cap(self) -> None:
+        server = _slow_server()
+        server.add_middleware(ConcurrencyLimitMiddleware(max_concurrent=1))
+        async with Client(server) as client:
+            results = await asyncio.gather(
+                client.call_tool("slow"),
+                client.call_tool("slow"),
+                return_exceptions=True,
+            )
+        errors = [r for r in results if isinstance(r, Exception)]
+        assert len(errors) == 1
+        assert "concurrent" in str(errors[0]).lower()
+
+    async def test_concurrency_slot_released(self) -> None:
+        server = _slow_server()
+        middleware = ConcurrencyLimitMiddleware(max_concurrent=1)
+        server.add_middleware(middleware)
+        async with Client(server) as client:
+            await client.call_tool("slow")
+            await client.call_tool("slow")
+        assert middleware.in_flight == {}
+
+    async def test_clients_limited_separately(self) -> None:
+        server = _slow_server()
+        clients = iter(["a", "b"])
+        server.add_middleware(
+            ConcurrencyLimitMiddleware(1, get_client_id=lambda ctx: next(clients))
+        )
+        async with Client(server) as client:
+            results = await asyncio.gather(
+                client.call_tool("slow"),
+                client.call_tool("slow"),
+                return_exceptions=True,
+            )
+        assert not any(isinstance(r, Exception) for r in results)
+
+    async def test_rate_limit(self, monkeypatch) -> None:
+        monkeypatch.setattr(snapshot, "SNAPSHOT_TTL", 0.0)
+        server = _slow_server()
+        configure_shared(server, snapshot_ttl=2.0, rate_limit=1, max_concurrent=0)
+        assert snapshot.SNAPSHOT_TTL == 2.0
+        async with Client(server) as client:
+            results = []
+            for _ in range(4):
+                try:
+                    await client.call_tool("slow")
+                    results.append(True)
+                except Exception:
+                    results.append(False)
+        assert False in results
+
+
+async def _calls_allowed(client: Client, calls: int) -> list[bool]:
+    results = []
+    for _ in range(calls):
+        try:
+            await client.call_tool("list_memory_usage")
+            results.append(True)
+        except Exception:
+            results.append(False)
+    return results
+
+
+class TestClientIdentity:
+    """Tests for telling real clients apart in a running daemon."""
+
+    async def test_http_clients_limited_separately(self, start_daemon) -> None:
+        # A burst of 4 requests: discovery, then tool listing and calls
+        url = start_daemon("--rate-limit", "2", "--max-concurrent", "0")
+        async with Client(url) as first, Client(url) as second:
+            assert False in await _calls_allowed(first, 6)
+            assert await _calls_allowed(second, 2) == [True, True]
+
+    async def test_unix_socket_clients_named_by_pid(
+        self, start_daemon, tmp_path
+    ) -> None:
+        path = start_daemon(
+            "--socket", str(tmp_path / "mcp.sock"), "--rate-limit", "1"
+        )
+
+        def over_socket(**kwargs) -> httpx2.AsyncClient:
+            return httpx2.AsyncClient(
+                transport=httpx2.AsyncHTTPTransport(uds=path), **kwargs
+            )
+
+        transport = StreamableHttpTransport(
+            "http://localhost/mcp", httpx_client_factory=over_socket
+        )
+        async with Client(transport) as client:
+            with pytest.raises(Exception, match=f"unix-pid:{os.getpid()}"):
+                for _ in range(4):
+                    await client.call_tool("list_memory_usage")
+
+
+class TestExposure:
+    """Tests for what an unauthenticated daemon exposes."""
+
+    @pytest.fixture(autouse=True)
+    def _restore_ttl(self, monkeypatch) -> None:
+        monkeypatch.setattr(snapshot, "SNAPSHOT_TTL", snapshot.SNAPSHOT_TTL)
+
+    async def test_kill_off_by_default(self) -> None:
+        server = FastMCP(name="test")
+        server.mount(mcp)
+        configure_shared(server, rate_limit=0, max_concurrent=0)
+        async with Client(server) as client:
+            tools = {t.name for t in await client.list_tools()}
+            with pytest.raises(Exception, match="kill_processes"):
+                await client.call_tool("kill_processes", {"pids": [999999999]})
+        assert "kill_processes" not in tools
+        assert "list_top_processes" in tools
+
+    async def test_allow_kill(self) -> None:
+        server = FastMCP(name="test")
+        server.mount(mcp)
+        configure_shared(server, rate_limit=0, max_concurrent=0, allow_kill=True)
+        async with Client(server) as client:
+            tools = {t.name for t in await client.list_tools()}
+        assert "kill_processes" in tools
+
+    def test_socket_private_to_user(self, start_daemon, tmp_path) -> None:
+        path = start_daemon("--socket", str(tmp_path / "mcp.sock"))
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+class TestArgs:
+    """Tests for command-line parsing."""
+
+    def test_defaults_to_stdio(self) -> None:
+        args = _parse_args([])
+        assert args.transport == "stdio"
+        assert args.socket is None
+
+    def test_daemon_options(self) -> None:
+        args = _parse_args(
+            ["--transport", "sse", "--port", "9000", "--max-concurrent", "8"]
+        )
+        assert args.transport == "sse"
+        assert args.port == 9000
+        assert args.max_concurrent == 8
+        assert not args.allow_kill
@@ -0,0 +1,102 @@
+"""Tests for process grouping keys."""
+
+import os
+import re
+import sys
+
+import psutil
+import pytest
+
+from mcp_memory import groupkeys
+from mcp_memory.groupkeys import GroupKeys, group_keys, normalize_cmdline
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["/usr/bin/python3", "-u", "/srv/worker.py", "-q", "a"], "python3 worker.py"),
+        (["python3.11", "-X", "dev", "-m", "pytest", "-q"], "python3.11 -m pytest"),
+        (["python3", "-c", "print(1)"], "python3 -c"),
+        (["python3", "-I", "-m", "pip", "install"], "python3 -m pip"),
+        (["python3", "-I", "script.py"], "python3 script.py"),
+        (["python3", "-x", "script.py"], "python3 script.py"),
+        (["python3", "-W", "ignore", "script.py"], "python3 script.py"),
+        (["ruby", "-I", "lib", "-r", "json", "app.rb"], "ruby app.rb"),
+        (["perl", "-I", "lib", "tool.pl"], "perl tool.pl"),
+        (["node", "--require", "ts-node/register", "server.ts"], "node server.ts"),
+        (["/bin/bash", "/etc/init.d/run.sh"], "bash run.sh"),
+        (["java", "-Xmx2g", "-cp", "a.jar", "org.gradle.Main"], "java org.gradle.Main"),
+        (["java", "-jar", "/opt/app/service.jar"], "java -jar service.jar"),
+        (["java", "-m", "app/app.Main"], "java -m app/app.Main"),
+        (["/usr/lib/firefox/firefox", "-contentproc"], "firefox"),
+        ([], "kworker/0:1"),
+    ],
+)
+def test_normalize_cmdline(argv, expected) -> None:
+    assert normalize_cmdline(argv, "kworker/0:1") == expected
+
+
+class TestContainer:
+    """Tests for container and PID namespace detection."""
+
+    @pytest.fixture
+    def fake_proc(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(groupkeys, "PROC_ROOT", str(tmp_path))
+        monkeypatch.setattr(groupkeys, "_own_pidns", "pid:[4026531836]")
+
+        def add(pid: int, cgroup: str, pidns: str) -> None:
+            (tmp_path / str(pid) / "ns").mkdir(parents=True)
+            (tmp_path / str(pid) / "cgroup").write_text(cgroup)
+            os.symlink(pidns, tmp_path / str(pid) / "ns" / "pid")
+
+        return add
+
+    def test_docker_container(self, fake_proc) -> None:
+        cid = "ab12" * 16
+        fake_proc(1, f"0::/system.slice/docker-{cid}.scope\n", "pid:[4026532001]")
+        assert groupkeys._container(1) == cid[:12]
+
+    def test_host(self, fake_proc) -> None:
+        fake_proc(2, "0::/user.slice/session-1.scope\n", "pid:[4026531836]")
+        assert groupkeys._container(2) == "host"
+
+    def test_other_pid_namespace(self, fake_proc) -> None:
+        fake_proc(3, "0::/\n", "pid:[4026532999]")
+        assert groupkeys._container(3) == "pidns:4026532999"
+
+    def test_unreadable(self, fake_proc) -> None:
+        assert groupkeys._container(4) == "?"
+
+
+class TestGroupKeys:
+    """Tests for computing and caching GroupKeys."""
+
+    def test_own_process(self) -> None:
+        keys = group_keys(psutil.Process(), None)
+        assert keys.user == psutil.Process().username()
+        assert keys.exe == psutil.Process().exe()
+
+    def test_cached_per_create_time(self, monkeypatch) -> None:
+        proc = psutil.Process()
+        first = group_keys(proc, None)
+        monkeypatch.setattr(psutil.Process, "cmdline", lambda self: pytest.fail())
+        assert group_keys(proc, None) is first
+
+        # A reused PID with a new start time is read again
+        groupkeys._cache[proc.pid] = GroupKeys(0.0, "old", "", "", "", "", "")
+        monkeypatch.undo()
+        assert group_keys(proc, None).name == first.name
+
+    def test_keys_interned(self) -> None:
+        keys = group_keys(psutil.Process(), None)
+        assert keys.user is sys.intern("".join(keys.user))
+
+    def test_regex_key(self) -> None:
+        keys = GroupKeys(0.0, "java", "", "", "", "", "java -Dapp=billing -jar x.jar")
+        assert keys.get("regex", re.compile(r"-Dapp=(\w+)")) == "billing"
+        assert keys.get("regex", re.compile(r"-jar \S+")) == "-jar x.jar"
+        assert keys.get("regex", re.compile(r"python")) is None
+
+    def test_regex_key_unmatched_group(self) -> None:
+        keys = GroupKeys(0.0, "python3", "", "", "", "", "python3 -m pytest")
+        assert keys.get("regex", re.compile(r"(zzz)?python")) == "python"
@@ -0,0 +1,80 @@
+"""Tests for the lazy-loading server."""
+
+import json
+import subprocess
+import sys
+
+from fastmcp import Client
+
+from mcp_memory.lazy import SCHEMAS_PATH, create_lazy_server, dump_schemas
+from mcp_memory.server import mcp
+
+
+async def test_schemas_up_to_date() -> None:
+    # Regenerate with: python -m mcp_memory.lazy > src/mcp_memory/schemas.json
+    assert json.loads(SCHEMAS_PATH.read_text()) == await dump_schemas()
+
+
+def test_startup_does_not_import_tools() -> None:
+    code = (
+        "import sys\n"
+        "from mcp_memory.lazy import create_lazy_server\n"
+        "assert create_lazy_server() is not None\n"
+        "loaded = [m for m in sys.modules if m.startswith('mcp_memory.')]\n"
+        "print(sorted(loaded))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "['mcp_memory.lazy']"
+
+
+def test_main_does_not_import_tools() -> None:
+    # Through the real entry point, with serving stubbed out
+    code = (
+        "import os, sys\n"
+        "from fastmcp import FastMCP\n"
+        "FastMCP.run = lambda self, *args, **kwargs: None\n"
+        "os.environ['MCP_MEMORY_LAZY'] = '1'\n"
+        "os.environ.pop('MCP_MEMORY_PEERS', None)\n"
+        "from mcp_memory.__main__ import _parse_args, main\n"
+        "_parse_args([])\n"
+        "main([])\n"
+        "loaded = [m for m in sys.modules if m.startswith('mcp_memory.')]\n"
+        "print(sorted(loaded))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == (
+        "['mcp_memory.__main__', 'mcp_memory.defaults', 'mcp_memory.lazy']"
+    )
+
+
+def test_missing_schemas_returns_none(tmp_path) -> None:
+    assert create_lazy_server(tmp_path / "missing.json") is None
+
+
+async def test_lists_same_tools_as_eager() -> None:
+    lazy = create_lazy_server()
+    async with Client(lazy) as lazy_client, Client(mcp) as eager_client:
+        lazy_tools = {t.name: t for t in await lazy_client.list_tools()}
+        eager_tools = {t.name: t for t in await eager_client.list_tools()}
+    assert lazy_tools.keys() == eager_tools.keys()
+    for name, tool in eager_tools.items():
+        assert lazy_tools[name].input_schema == tool.input_schema
+        assert lazy_tools[name].output_schema == tool.output_schema
+
+
+async def test_calls_load_real_tools() -> None:
+    lazy = create_lazy_server()
+    async with Client(lazy) as lazy_client, Client(mcp) as eager_client:
+        args = {"pids": [0, 1]}
+        lazy_result = await lazy_client.call_tool("kill_processes", args)
+        eager_result = await eager_client.call_tool("kill_processes", args)
+        assert lazy_result.structured_content == eager_result.structured_content
+
+        result = await lazy_client.call_tool(
+            "list_top_processes", {"n": 2, "format": "table", "fields": ["pid"]}
+        )
+        assert result.structured_content["result"]["columns"] == ["pid"]
@@ -0,0 +1,89 @@
+"""Tests for cursor pagination over retained result sets."""
+
+import heapq
+
+import pytest
+
+from mcp_memory import pagination
+from mcp_memory.pagination import CursorStore, ResultSet, decode_cursor, encode_cursor
+
+
+def _rows(n: int) -> list[dict]:
+    return [{"pid": pid, "value": (pid * 37) % 11} for pid in range(n)]
+
+
+def _key(row: dict) -> tuple:
+    return -row["value"], row["pid"]
+
+
+class TestResultSet:
+    """Tests for ResultSet."""
+
+    def test_pages_in_key_order(self) -> None:
+        rows = _rows(50)
+        result_set = ResultSet(rows, _key)
+        pages = [result_set.page(offset, 7) for offset in range(0, 50, 7)]
+        assert [r for page in pages for r in page] == sorted(rows, key=_key)
+
+    def test_materializes_lazily(self, monkeypatch) -> None:
+        pops = []
+        heappop = heapq.heappop
+
+        def counting_pop(heap):
+            pops.append(1)
+            return heappop(heap)
+
+        monkeypatch.setattr(pagination.heapq, "heappop", counting_pop)
+        result_set = ResultSet(_rows(1000), _key)
+        result_set.page(0, 10)
+        assert len(pops) == 10
+        # Earlier pages are served again without popping
+        result_set.page(0, 10)
+        assert len(pops) == 10
+
+    def test_page_past_end(self) -> None:
+        assert ResultSet(_rows(3), _key).page(5, 10) == []
+
+
+class TestCursors:
+    """Tests for cursor encoding and the cursor store."""
+
+    def test_round_trip(self) -> None:
+        assert decode_cursor(encode_cursor("abc_-1", 40, 20)) == ("abc_-1", 40, 20)
+
+    @pytest.mark.parametrize("cursor", ["", "!!!", encode_cursor("x", -1, 5)])
+    def test_malformed(self, cursor) -> None:
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    def test_walks_pages(self) -> None:
+        store = CursorStore()
+        builds = []
+
+        def build() -> ResultSet:
+            builds.append(1)
+            return ResultSet(_rows(25), _key)
+
+        _, rows, cursor = store.page(None, 10, build)
+        seen = list(rows)
+        while cursor:
+            _, rows, cursor = store.page(cursor, None, build)
+            seen.extend(rows)
+        assert seen == sorted(_rows(25), key=_key)
+        assert len(builds) == 1
+
+    def test_expired(self) -> None:
+        store = CursorStore(ttl=0)
+        _, _, cursor = store.page(None, 1, lambda: ResultSet(_rows(5), _key))
+        with pytest.raises(ValueError, match="expired"):
+            store.page(cursor, None, lambda: ResultSet([], _key))
+
+    def test_evicts_oldest(self) -> None:
+        store = CursorStore(max_sets=2)
+        cursors = [
+            store.page(None, 1, lambda: ResultSet(_rows(5), _key))[2]
+            for _ in range(3)
+        ]
+        with pytest.raises(ValueError):
+            store.page(cursors[0], None, lambda: ResultSet([], _key))
+        assert store.page(cursors[2], None, lambda: ResultSet([], _key))[1]
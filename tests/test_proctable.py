@@ -0,0 +1,326 @@
+"""Tests for the live process table."""
+
+import errno
+import itertools
+import os
+import struct
+import threading
+import time
+
+import psutil
+import pytest
+
+from mcp_memory import proctable
+from mcp_memory.proctable import (
+    EXEC,
+    EXIT,
+    FORK,
+    PROC_EVENT_EXEC,
+    PROC_EVENT_EXIT,
+    PROC_EVENT_FORK,
+    RESYNC,
+    NetlinkEventSource,
+    PollingEventSource,
+    ProcessEntry,
+    ProcessTable,
+    ProcEvent,
+    get_process_table,
+    open_event_source,
+    parse_netlink_events,
+)
+from mcp_memory.tools import processes
+
+
+def _netlink_message(what: int, *pids: int) -> bytes:
+    """Pack a proc connector message as the kernel would send it."""
+    body = struct.pack("=IIQ", what, 0, 0) + struct.pack(f"={len(pids)}i", *pids)
+    cn_msg = struct.pack("=IIIIHH", 1, 1, 0, 0, len(body), 0)
+    length = 16 + len(cn_msg) + len(body)
+    return struct.pack("=IHHII", length, 3, 0, 0, 0) + cn_msg + body
+
+
+class ListSource:
+    """Event source replaying a fixed list of events."""
+
+    def __init__(self, events: list[ProcEvent]) -> None:
+        self._events = events
+        self.closed = False
+
+    def events(self):
+        yield from self._events
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _fake_load(pid: int) -> ProcessEntry | None:
+    if pid >= 1000:
+        return None
+    return ProcessEntry(
+        pid=pid,
+        name=f"proc{pid}",
+        username="user",
+        create_time=float(pid),
+        cmdline=f"/bin/proc{pid}",
+        process=psutil.Process(os.getpid()),
+    )
+
+
+class TestParseNetlinkEvents:
+    """Tests for proc connector message parsing."""
+
+    def test_fork(self) -> None:
+        data = _netlink_message(PROC_EVENT_FORK, 1, 1, 42, 42)
+        assert list(parse_netlink_events(data)) == [ProcEvent(FORK, 42)]
+
+    def test_exec(self) -> None:
+        data = _netlink_message(PROC_EVENT_EXEC, 42, 42)
+        assert list(parse_netlink_events(data)) == [ProcEvent(EXEC, 42)]
+
+    def test_exit(self) -> None:
+        data = _netlink_message(PROC_EVENT_EXIT, 42, 42, 0, 0)
+        assert list(parse_netlink_events(data)) == [ProcEvent(EXIT, 42)]
+
+    def test_ignores_threads(self) -> None:
+        data = _netlink_message(PROC_EVENT_FORK, 1, 1, 43, 42)
+        data += _netlink_message(PROC_EVENT_EXIT, 43, 42, 0, 0)
+        assert list(parse_netlink_events(data)) == []
+
+    def test_ignores_other_events(self) -> None:
+        data = _netlink_message(0x00000004, 42, 42, 0, 0)
+        assert list(parse_netlink_events(data)) == []
+
+    def test_multiple_messages(self) -> None:
+        data = _netlink_message(PROC_EVENT_FORK, 1, 1, 42, 42)
+        data += _netlink_message(PROC_EVENT_EXIT, 7, 7, 0, 0)
+        assert list(parse_netlink_events(data)) == [
+            ProcEvent(FORK, 42),
+            ProcEvent(EXIT, 7),
+        ]
+
+
+class FakeSocket:
+    """Netlink socket stand-in replaying datagrams and errors."""
+
+    def __init__(self, items: list, source: NetlinkEventSource) -> None:
+        self._items = iter(items)
+        self._source = source
+
+    def recv(self, size: int) -> bytes:
+        item = next(self._items, None)
+        if item is None:
+            self._source._closed.set()
+            raise OSError(errno.EBADF, "closed")
+        if isinstance(item, OSError):
+            raise item
+        return item
+
+
+def _netlink_source(items: list) -> NetlinkEventSource:
+    source = object.__new__(NetlinkEventSource)
+    source._closed = threading.Event()
+    source._sock = FakeSocket(items, source)
+    return source
+
+
+class TestNetlinkEventSource:
+    """Tests for reading the proc connector socket."""
+
+    def test_overrun_requests_resync(self) -> None:
+        source = _netlink_source(
+            [
+                _netlink_message(PROC_EVENT_EXIT, 5, 5),
+                OSError(errno.ENOBUFS, "No buffer space available"),
+                _netlink_message(PROC_EVENT_EXEC, 6, 6),
+            ]
+        )
+        assert list(source.events()) == [
+            ProcEvent(EXIT, 5),
+            ProcEvent(RESYNC, 0),
+            ProcEvent(EXEC, 6),
+        ]
+
+    def test_other_errors_raise(self) -> None:
+        source = _netlink_source([OSError(errno.EIO, "I/O error")])
+        with pytest.raises(OSError):
+            list(source.events())
+
+
+class TestPollingEventSource:
+    """Tests for the diff-scan fallback."""
+
+    def test_diffs_pid_lists(self) -> None:
+        listings = iter([[1, 2, 3], [1, 3, 4], [1, 3, 4]])
+        source = PollingEventSource(interval=0, list_pids=lambda: next(listings))
+        events = list(itertools.islice(source.events(), 5))
+        assert events == [
+            ProcEvent(FORK, 1),
+            ProcEvent(FORK, 2),
+            ProcEvent(FORK, 3),
+            ProcEvent(EXIT, 2),
+            ProcEvent(FORK, 4),
+        ]
+
+    def test_close_stops_events(self) -> None:
+        source = PollingEventSource(interval=0, list_pids=lambda: [1])
+        source.close()
+        assert list(source.events()) == []
+
+    def test_poll_mode_skips_netlink(self) -> None:
+        assert isinstance(open_event_source("poll"), PollingEventSource)
+
+
+class TestProcessTable:
+    """Tests for ProcessTable driven by injected event sources."""
+
+    def test_initial_scan(self) -> None:
+        table = ProcessTable(ListSource([]), load=_fake_load, list_pids=lambda: [1, 2])
+        table.scan()
+        assert [e.pid for e in table.snapshot()] == [1, 2]
+        assert table.get(1).name == "proc1"
+
+    def test_scan_skips_vanished(self) -> None:
+        table = ProcessTable(ListSource([]), load=_fake_load, list_pids=lambda: [1, 1000])
+        table.scan()
+        assert len(table) == 1
+
+    def test_follows_events(self) -> None:
+        source = ListSource(
+            [ProcEvent(FORK, 3), ProcEvent(EXIT, 1), ProcEvent(EXEC, 2)]
+        )
+        table = ProcessTable(source, load=_fake_load, list_pids=lambda: [1, 2])
+        table.start()
+        table.stop()
+        assert source.closed
+        assert [e.pid for e in table.snapshot()] == [2, 3]
+
+    def test_exec_reloads_attributes(self) -> None:
+        names = iter(["before", "after"])
+
+        def load(pid: int) -> ProcessEntry:
+            entry = _fake_load(pid)
+            entry.name = next(names)
+            return entry
+
+        table = ProcessTable(ListSource([]), load=load)
+        table.apply(ProcEvent(FORK, 5))
+        table.apply(ProcEvent(EXEC, 5))
+        assert table.get(5).name == "after"
+
+    def test_fork_of_vanished_process_is_dropped(self) -> None:
+        table = ProcessTable(ListSource([]), load=_fake_load)
+        table.apply(ProcEvent(FORK, 1000))
+        assert 1000 not in table
+
+    def test_duplicate_fork_keeps_entry(self) -> None:
+        calls = []
+
+        def load(pid: int) -> ProcessEntry:
+            calls.append(pid)
+            proc = psutil.Process(pid)
+            return ProcessEntry(pid, "self", "user", proc.create_time(), "", proc)
+
+        pid = os.getpid()
+        table = ProcessTable(ListSource([]), load=load)
+        table.apply(ProcEvent(FORK, pid))
+        table.apply(ProcEvent(FORK, pid))
+        assert calls == [pid]
+
+    def test_fork_of_reused_pid_reloads(self) -> None:
+        calls = []
+
+        def load(pid: int) -> ProcessEntry:
+            calls.append(pid)
+            return _fake_load(pid)
+
+        table = ProcessTable(ListSource([]), load=load)
+        table.apply(ProcEvent(FORK, 5))
+        # The cached create_time does not match the live process
+        table.apply(ProcEvent(FORK, 5))
+        assert calls == [5, 5]
+
+    def test_resync_rescans(self) -> None:
+        pids = [1, 2]
+        table = ProcessTable(ListSource([]), load=_fake_load, list_pids=lambda: pids)
+        table.scan()
+        pids[:] = [2, 3]
+        table.apply(ProcEvent(RESYNC, 0))
+        assert [e.pid for e in table.snapshot()] == [2, 3]
+
+    def test_failed_source_falls_back_to_polling(self) -> None:
+        class FailingSource(ListSource):
+            def events(self):
+                yield ProcEvent(FORK, 3)
+                raise OSError(errno.EIO, "I/O error")
+
+        pids = [1, 2]
+        source = FailingSource([])
+        table = ProcessTable(
+            source, load=_fake_load, list_pids=lambda: pids, fallback_interval=0.01
+        )
+        table.start()
+        try:
+            # Processes appearing after the failure are still picked up
+            pids[:] = [2, 4]
+            deadline = time.monotonic() + 5
+            while [e.pid for e in table.snapshot()] != [2, 4]:
+                assert time.monotonic() < deadline, table.snapshot()
+                time.sleep(0.01)
+            assert source.closed
+        finally:
+            table.stop()
+
+    def test_with_polling_source(self) -> None:
+        listings = iter([[1, 2], [2, 3]])
+        source = PollingEventSource(interval=0, list_pids=lambda: next(listings, [2, 3]))
+        table = ProcessTable(source, load=_fake_load, list_pids=lambda: [1, 2])
+        for event in itertools.islice(source.events(), 4):
+            table.apply(event)
+        assert [e.pid for e in table.snapshot()] == [2, 3]
+
+
+class TestGetProcessTable:
+    """Tests for the shared table and its use by the process tools."""
+
+    def test_disabled_by_default(self, monkeypatch) -> None:
+        monkeypatch.delenv("MCP_MEMORY_PROC_TABLE", raising=False)
+        assert get_process_table() is None
+
+    def test_poll_mode_starts_table(self, monkeypatch) -> None:
+        monkeypatch.setenv("MCP_MEMORY_PROC_TABLE", "poll")
+        monkeypatch.setattr(proctable, "_table", None)
+        table = get_process_table()
+        try:
+            assert table is not None
+            assert os.getpid() in table
+            assert get_process_table() is table
+        finally:
+            table.stop()
+
+    @pytest.mark.skipif(os.geteuid() != 0, reason="proc connector needs CAP_NET_ADMIN")
+    def test_netlink_source_opens_as_root(self) -> None:
+        source = open_event_source("auto")
+        source.close()
+
+    def test_tools_reload_reused_pid(self, monkeypatch) -> None:
+        pid = os.getpid()
+        table = ProcessTable(ListSource([]), list_pids=lambda: [pid])
+        table.scan()
+        # Cached attributes of an earlier process that had the same PID
+        stale = table.get(pid)
+        table._entries[pid] = ProcessEntry(
+            pid, "old", "nobody", stale.create_time - 100, "/bin/old", stale.process
+        )
+        monkeypatch.setattr(processes, "get_process_table", lambda: table)
+        result = processes.list_top_processes(n=10)
+        assert result[0].name == stale.name
+        assert result[0].cmdline == stale.cmdline[:200]
+        assert table.get(pid).name == stale.name
+
+    def test_tools_use_table(self, monkeypatch) -> None:
+        table = ProcessTable(ListSource([]), list_pids=lambda: [os.getpid()])
+        table.scan()
+        monkeypatch.setattr(processes, "get_process_table", lambda: table)
+        result = processes.list_top_processes(n=10)
+        assert [p.pid for p in result] == [os.getpid()]
+        assert result[0].name == table.get(os.getpid()).name
@@ -2,9 +2,21 @@
 
 import os
 
+import psutil
 import pytest
 
-from mcp_memory.models import KillSummary, MemoryInfo, ProcessGroup, ProcessInfo
+from mcp_memory import groupkeys, snapshot
+from mcp_memory.models import (
+    KillSummary,
+    MemoryInfo,
+    ProcessGroup,
+    ProcessInfo,
+    ProcessMemoryMap,
+    ProcessPage,
+    SwapReport,
+    TableResult,
+)
+from mcp_memory.tools import processes, smaps, swap
 from mcp_memory.tools.kill import kill_processes
 from mcp_memory.tools.memory import _generate_warnings, list_memory_usage
 from mcp_memory.tools.processes import (
@@ -12,6 +24,8 @@ from mcp_memory.tools.processes import (
     list_process_groups,
     list_top_processes,
 )
+from mcp_memory.tools.smaps import inspect_process_memory
+from mcp_memory.tools.swap import list_swapped_processes
 
 
 class TestListMemoryUsage:
@@ -159,6 +173,59 @@ class TestListProcessGroups:
             assert group.total_memory_percent >= 0
             assert isinstance(group.pids, list)
 
+    @pytest.mark.parametrize("group_by", ["exe", "cmdline", "user", "container"])
+    def test_group_by_partitions_processes(self, group_by) -> None:
+        grouped = list_process_groups(n=50, group_by=group_by)
+        assert grouped
+        pids = [pid for group in grouped for pid in group.pids]
+        assert len(pids) == len(set(pids))
+
+    def test_group_by_user(self) -> None:
+        result = list_process_groups(n=50, group_by="user")
+        assert psutil.Process().username() in [g.name for g in result]
+
+    def test_group_by_regex_capture(self) -> None:
+        result = list_process_groups(n=50, group_by="regex", pattern=r"-m (pytest)")
+        assert [g.name for g in result] == ["pytest"]
+        assert os.getpid() in result[0].pids
+
+    def test_group_by_regex_optional_group(self) -> None:
+        result = list_process_groups(
+            n=50, group_by="regex", pattern=r"(zzz)?-m pytest"
+        )
+        assert [g.name for g in result] == ["-m pytest"]
+
+    def test_regex_requires_valid_pattern(self) -> None:
+        with pytest.raises(ValueError):
+            list_process_groups(group_by="regex")
+        with pytest.raises(ValueError):
+            list_process_groups(group_by="regex", pattern="(")
+
+    def test_invalid_group_by(self) -> None:
+        with pytest.raises(ValueError):
+            list_process_groups(group_by="color")
+
+    def test_regroup_reuses_cached_keys(self, monkeypatch) -> None:
+        list_process_groups(n=50, group_by="exe")
+        reads = []
+        monkeypatch.setattr(psutil.Process, "exe", lambda self: reads.append(1))
+        monkeypatch.setattr(groupkeys, "_container", lambda pid: reads.append(1))
+        list_process_groups(n=50, group_by="container")
+        list_process_groups(n=50, group_by="cmdline")
+        # Only processes started since the first call are read
+        assert len(reads) <= 2
+
+    def test_regroup_snapshot_without_scan(self, monkeypatch) -> None:
+        monkeypatch.setattr(snapshot, "SNAPSHOT_TTL", 60.0)
+        processes._snapshot.invalidate()
+        by_exe = list_process_groups(n=50, group_by="exe")
+        monkeypatch.setattr(
+            processes, "_iter_processes", lambda: pytest.fail("rescanned")
+        )
+        by_user = list_process_groups(n=50, group_by="user")
+        assert sum(g.count for g in by_user) >= sum(g.count for g in by_exe)
+        processes._snapshot.invalidate()
+
 
 class TestFindStaleProcesses:
     """Tests for find_stale_processes."""
@@ -189,6 +256,482 @@ class TestFindStaleProcesses:
             assert "python" in proc.name.lower()
 
 
+class TestTableFormat:
+    """Tests for the compact table format and field projection."""
+
+    def test_top_processes_table(self) -> None:
+        result = list_top_processes(n=5, format="table")
+        assert isinstance(result, TableResult)
+        assert "age_formatted" not in result.columns
+        assert len(result.rows) <= 5
+        for row in result.rows:
+            assert len(row) == len(result.columns)
+
+    def test_projection(self) -> None:
+        result = list_top_processes(
+            n=10, format="table", fields=["pid", "name", "memory_mb"]
+        )
+        assert result.columns == ["pid", "name", "memory_mb"]
+        memory = [row[2] for row in result.rows]
+        assert memory == sorted(memory, reverse=True)
+
+    def test_sort_field_collected_but_not_returned(self) -> None:
+        result = list_top_processes(n=5, sort_by="cpu", format="table", fields=["pid"])
+        assert result.columns == ["pid"]
+        assert all(len(row) == 1 for row in result.rows)
+
+    def test_unrequested_attributes_not_read(self, monkeypatch) -> None:
+        def fail(self):
+            raise AssertionError("cmdline should not be read")
+
+        monkeypatch.setattr(psutil.Process, "cmdline", fail)
+        monkeypatch.setattr(psutil.Process, "username", fail)
+        result = list_top_processes(n=5, format="table", fields=["pid", "memory_mb"])
+        assert len(result.rows) > 0
+
+    def test_matches_object_format(self) -> None:
+        fields = ["pid", "name", "username"]
+        table = find_stale_processes(min_age_hours=0, format="table", fields=fields)
+        objects = find_stale_processes(min_age_hours=0)
+        # Processes may come and go between the two scans
+        by_pid = {p.pid: p for p in objects}
+        for pid, name, username in table.rows:
+            if pid in by_pid:
+                assert (name, username) == (by_pid[pid].name, by_pid[pid].username)
+
+    def test_cmdline_max(self) -> None:
+        for proc in list_top_processes(n=20, cmdline_max=5):
+            assert len(proc.cmdline) <= 5
+        result = list_top_processes(
+            n=20, format="table", fields=["cmdline"], cmdline_max=0
+        )
+        assert all(row == [""] for row in result.rows)
+
+    def test_groups_table(self) -> None:
+        result = list_process_groups(n=5, format="table", fields=["name", "count"])
+        assert result.columns == ["name", "count"]
+        counts = [row[1] for row in result.rows]
+        assert all(c >= 1 for c in counts)
+
+    def test_fields_require_table_format(self) -> None:
+        with pytest.raises(ValueError, match="format='table'"):
+            list_top_processes(fields=["pid"])
+        with pytest.raises(ValueError, match="format='table'"):
+            list_process_groups(fields=["name"])
+
+    def test_unknown_field_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown fields"):
+            list_top_processes(format="table", fields=["pid", "bogus"])
+
+    def test_invalid_format_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid format"):
+            list_process_groups(format="csv")
+
+
+class TestShardedScanning:
+    """Tests for sharded /proc scanning across a worker pool."""
+
+    @staticmethod
+    def _info(pid: int) -> ProcessInfo:
+        # Few distinct memory values so ties and shared names are common
+        return ProcessInfo(
+            pid=pid,
+            name=f"proc{pid % 7}",
+            username="user",
+            memory_mb=float(pid % 5) + 0.01,
+            memory_percent=0.1,
+            cpu_percent=float(pid % 3),
+            status="sleeping",
+            create_time=0.0,
+            age_hours=10.0,
+            age_formatted="10h",
+            started_at="Jan 01 00:00",
+            cmdline="",
+        )
+
+    @pytest.fixture
+    def fake_scan(self, monkeypatch):
+        items = [(pid, None) for pid in range(1, 200)]
+        monkeypatch.setattr(processes, "_iter_processes", lambda: iter(items))
+
+        def collect(pid, entry, fields, cmdline_max):
+            row = self._info(pid).model_dump()
+            return {k: v for k, v in row.items() if k == "pid" or k in fields}
+
+        monkeypatch.setattr(processes, "_collect_process", collect)
+
+    def _run_all(self) -> tuple:
+        return (
+            list_top_processes(n=20),
+            list_top_processes(n=20, sort_by="cpu"),
+            find_stale_processes(min_memory_mb=2),
+            list_process_groups(n=50),
+        )
+
+    @pytest.mark.parametrize("workers", [2, 3, 8])
+    def test_threads_match_serial(self, fake_scan, monkeypatch, workers) -> None:
+        serial = self._run_all()
+        monkeypatch.setattr(processes, "SCAN_WORKERS", workers)
+        assert self._run_all() == serial
+
+    def test_ties_broken_by_pid(self, fake_scan, monkeypatch) -> None:
+        monkeypatch.setattr(processes, "SCAN_WORKERS", 4)
+        result = list_top_processes(n=5)
+        assert [p.pid for p in result] == [4, 9, 14, 19, 24]
+
+    def test_group_pids_sorted(self, fake_scan, monkeypatch) -> None:
+        monkeypatch.setattr(processes, "SCAN_WORKERS", 4)
+        for group in list_process_groups(n=50):
+            assert group.pids == sorted(group.pids)
+
+    def test_process_pool(self, monkeypatch) -> None:
+        monkeypatch.setattr(processes, "SCAN_WORKERS", 2)
+        monkeypatch.setattr(processes, "SCAN_MODE", "process")
+        result = list_top_processes(n=5)
+        assert 0 < len(result) <= 5
+        for i in range(len(result) - 1):
+            assert result[i].memory_mb >= result[i + 1].memory_mb
+        groups = list_process_groups(n=50)
+        assert sum(g.count for g in groups) > 0
+
+    def test_process_pool_left_out_of_scans(self, monkeypatch) -> None:
+        monkeypatch.setattr(processes, "SCAN_WORKERS", 2)
+        monkeypatch.setattr(processes, "SCAN_MODE", "process")
+        list_process_groups(n=50)
+        helpers = {c.pid for c in psutil.Process().children(recursive=True)}
+        assert helpers
+        groups = list_process_groups(n=50, group_by="cmdline")
+        assert not helpers & {pid for g in groups for pid in g.pids}
+
+    def test_pool_replaced_when_workers_change(self, monkeypatch) -> None:
+        monkeypatch.setattr(processes, "SCAN_WORKERS", 2)
+        list_top_processes(n=5)
+        _, old = processes._executors["thread"]
+        monkeypatch.setattr(processes, "SCAN_WORKERS", 3)
+        list_top_processes(n=5)
+        assert processes._executors["thread"][0] == 3
+        with pytest.raises(RuntimeError):
+            old.submit(int)
+
+    def test_process_pool_uses_threads_for_cpu(self, monkeypatch) -> None:
+        monkeypatch.setattr(processes, "SCAN_WORKERS", 2)
+        monkeypatch.setattr(processes, "SCAN_MODE", "process")
+        modes = []
+        get_executor = processes._get_executor
+
+        def record(mode, workers):
+            modes.append(mode)
+            return get_executor(mode, workers)
+
+        monkeypatch.setattr(processes, "_get_executor", record)
+        list_top_processes(n=5, sort_by="cpu", format="table", fields=["pid"])
+        list_top_processes(n=5)
+        list_top_processes(n=5, format="table", fields=["pid", "memory_mb"])
+        assert modes == ["thread", "thread", "process"]
+
+
+class TestPagination:
+    """Tests for cursor pagination of process listings."""
+
+    @pytest.fixture
+    def fake_scan(self, monkeypatch):
+        items = [(pid, None) for pid in range(1, 200)]
+        scans = []
+
+        def iter_processes():
+            scans.append(1)
+            return iter(items)
+
+        monkeypatch.setattr(processes, "_iter_processes", iter_processes)
+
+        def collect(pid, entry, fields, cmdline_max):
+            row = TestShardedScanning._info(pid).model_dump()
+            return {k: v for k, v in row.items() if k == "pid" or k in fields}
+
+        monkeypatch.setattr(processes, "_collect_process", collect)
+        return scans
+
+    def _read_all(self, first: ProcessPage, **kwargs) -> list:
+        pages = [first]
+        while pages[-1].next_cursor:
+            pages.append(
+                find_stale_processes(cursor=pages[-1].next_cursor, **kwargs)
+            )
+        return pages
+
+    def test_pages_cover_full_sorted_result(self, fake_scan) -> None:
+        expected = find_stale_processes(min_memory_mb=2)
+        pages = self._read_all(find_stale_processes(min_memory_mb=2, page_size=30))
+        assert isinstance(pages[0], ProcessPage)
+        assert pages[0].total == len(expected)
+        assert [len(p.items) for p in pages[:-1]] == [30] * (len(pages) - 1)
+        assert [p for page in pages for p in page.items] == expected
+
+    def test_later_pages_do_not_rescan(self, fake_scan) -> None:
+        self._read_all(find_stale_processes(page_size=10))
+        assert len(fake_scan) == 1
+
+    def test_cursor_keeps_format_and_filters(self, fake_scan) -> None:
+        first = find_stale_processes(
+            min_memory_mb=4, page_size=5, format="table", fields=["pid"]
+        )
+        second = find_stale_processes(cursor=first.next_cursor)
+        assert isinstance(second.items, TableResult)
+        assert second.items.columns == ["pid"]
+        assert first.total == len(find_stale_processes(min_memory_mb=4))
+
+    def test_top_processes_beyond_100(self, fake_scan) -> None:
+        first = list_top_processes(page_size=100, sort_by="cpu")
+        second = list_top_processes(cursor=first.next_cursor)
+        assert first.total == 199
+        assert len(second.items) == 99
+        assert second.next_cursor is None
+        assert [p.pid for p in first.items[:3]] == [2, 5, 8]
+        cpus = [p.cpu_percent for p in first.items + second.items]
+        assert cpus == sorted(cpus, reverse=True)
+
+    def test_page_size_clamped(self, fake_scan) -> None:
+        assert len(list_top_processes(page_size=1000).items) == 100
+
+    def test_groups_pages_cover_all_groups(self, fake_scan) -> None:
+        expected = list_process_groups(n=50)
+        first = list_process_groups(page_size=4)
+        second = list_process_groups(cursor=first.next_cursor)
+        assert first.total == len(expected) == 7
+        assert first.items + second.items == expected
+        assert second.next_cursor is None
+
+    def test_cursor_of_other_listing(self, fake_scan) -> None:
+        first = find_stale_processes(page_size=5)
+        with pytest.raises(ValueError, match="different listing"):
+            list_process_groups(cursor=first.next_cursor)
+
+    def test_invalid_cursor(self) -> None:
+        with pytest.raises(ValueError):
+            find_stale_processes(cursor="not-a-cursor")
+
+
+class TestListSwappedProcesses:
+    """Tests for list_swapped_processes."""
+
+    @pytest.fixture
+    def fake_proc(self, tmp_path, monkeypatch):
+        proc = tmp_path / "proc"
+        sys_root = tmp_path / "sys"
+
+        def add(pid: int, name: str, swap_kb: int | None) -> None:
+            lines = [f"Name:\t{name}", "Uid:\t0\t0\t0\t0", "VmRSS:\t    2048 kB"]
+            if swap_kb is not None:
+                lines.append(f"VmSwap:\t{swap_kb:8d} kB")
+            (proc / str(pid)).mkdir(parents=True)
+            (proc / str(pid) / "status").write_text("\n".join(lines) + "\n")
+
+        add(10, "java", 4096)
+        add(11, "java", 1024)
+        add(12, "bash", 2048)
+        add(13, "idle", 0)
+        add(14, "kthreadd", None)
+        (proc / "meminfo").write_text("Zswap:     1024 kB\nZswapped:  4096 kB\n")
+
+        params = sys_root / "module" / "zswap" / "parameters"
+        params.mkdir(parents=True)
+        (params / "enabled").write_text("Y\n")
+        (params / "compressor").write_text("zstd\n")
+        zram = sys_root / "block" / "zram0"
+        zram.mkdir(parents=True)
+        (zram / "disksize").write_text(f"{1024**3}\n")
+        (zram / "mm_stat").write_text(f"{4 * 1024**2} {1024**2} {2 * 1024**2} 0 0 0 0\n")
+
+        monkeypatch.setattr(swap, "PROC_ROOT", str(proc))
+        monkeypatch.setattr(swap, "SYS_ROOT", str(sys_root))
+
+    def test_returns_swap_report(self) -> None:
+        result = list_swapped_processes(n=5)
+        assert isinstance(result, SwapReport)
+        assert len(result.processes) <= 5
+        assert len(result.groups) <= 5
+
+    def test_live_sorted_by_swap_descending(self) -> None:
+        result = list_swapped_processes(n=100)
+        for i in range(len(result.processes) - 1):
+            assert result.processes[i].swap_mb >= result.processes[i + 1].swap_mb
+        for proc in result.processes:
+            assert proc.swap_mb > 0
+
+    def test_skips_unswapped_processes(self, fake_proc) -> None:
+        result = list_swapped_processes(n=10)
+        assert [p.pid for p in result.processes] == [10, 12, 11]
+        assert result.processes[0].name == "java"
+        assert result.processes[0].swap_mb == 4.0
+        assert result.processes[0].rss_mb == 2.0
+        assert result.processes[0].username == "root"
+        assert result.attributed_swap_mb == 7.0
+
+    def test_groups_by_name(self, fake_proc) -> None:
+        result = list_swapped_processes(n=10)
+        assert result.groups[0].name == "java"
+        assert result.groups[0].count == 2
+        assert result.groups[0].total_swap_mb == 5.0
+        assert sorted(result.groups[0].pids) == [10, 11]
+
+    def test_min_swap_filters(self, fake_proc) -> None:
+        result = list_swapped_processes(n=10, min_swap_mb=2.0)
+        assert [p.pid for p in result.processes] == [10, 12]
+        # Filtered processes still count towards attribution
+        assert result.attributed_swap_mb == 7.0
+
+    def test_reports_zswap_and_zram(self, fake_proc) -> None:
+        result = list_swapped_processes()
+        assert result.zswap is not None
+        assert result.zswap.enabled
+        assert result.zswap.compressor == "zstd"
+        assert result.zswap.pool_mb == 1.0
+        assert result.zswap.stored_mb == 4.0
+        assert len(result.zram) == 1
+        assert result.zram[0].device == "zram0"
+        assert result.zram[0].compression_ratio == 4.0
+
+    def test_no_zswap_or_zram(self, fake_proc, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(swap, "SYS_ROOT", str(tmp_path / "missing"))
+        result = list_swapped_processes()
+        assert result.zswap is None
+        assert result.zram == []
+
+
+class TestInspectProcessMemory:
+    """Tests for inspect_process_memory."""
+
+    @staticmethod
+    def _mapping(header: str, rss_kb: int, swap_kb: int = 0) -> str:
+        return (
+            f"{header}\n"
+            f"Size:             {rss_kb * 2} kB\n"
+            f"Rss:              {rss_kb} kB\n"
+            f"Pss:              {rss_kb // 2} kB\n"
+            "Shared_Clean:          0 kB\n"
+            f"Swap:             {swap_kb} kB\n"
+            "SwapPss:               0 kB\n"
+            "VmFlags: rd wr mr mw me ac\n"
+        )
+
+    @pytest.fixture
+    def fake_proc(self, tmp_path, monkeypatch):
+        pid_dir = tmp_path / "4242"
+        pid_dir.mkdir()
+        (pid_dir / "comm").write_text("java\n")
+        (pid_dir / "smaps").write_text(
+            self._mapping("00400000-00500000 r-xp 00000000 fd:01 42 /usr/bin/java", 1024)
+            + self._mapping("00600000-00700000 rw-p 00000000 00:00 0 [heap]", 2048)
+            + self._mapping("7f000000-7f100000 rw-p 00000000 00:00 0", 8192, swap_kb=512)
+            + self._mapping("7f100000-7f200000 rw-p 00000000 00:00 0", 4096)
+            + self._mapping("7f200000-7f300000 rw-s 00000000 00:05 7 /dev/shm/buf", 3072)
+            + self._mapping("7f300000-7f400000 r--p 00000000 fd:01 43 /usr/lib/libjvm.so", 512)
+            + self._mapping("7f400000-7f500000 r--p 00001000 fd:01 43 /usr/lib/libjvm.so", 512)
+            + self._mapping("7ffd0000-7ffe0000 rw-p 00000000 00:00 0 [stack]", 64)
+            + self._mapping("7ffe0000-7ffe1000 r-xp 00000000 00:00 0 [vdso]", 4)
+        )
+        monkeypatch.setattr(smaps, "PROC_ROOT", str(tmp_path))
+        return 4242
+
+    def test_inspects_own_process(self) -> None:
+        result = inspect_process_memory(os.getpid(), n=5)
+        assert isinstance(result, ProcessMemoryMap)
+        assert result.mapping_count > 0
+        assert result.rss_mb > 0
+        assert len(result.top_mappings) <= 5
+
+    def test_nonexistent_pid_raises(self) -> None:
+        with pytest.raises(ValueError, match="does not exist"):
+            inspect_process_memory(999999999)
+
+    def test_process_exiting_mid_read_raises(self, fake_proc, monkeypatch) -> None:
+        real_open = open
+
+        class Vanishing:
+            def __init__(self, f) -> None:
+                self.f = f
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc) -> None:
+                self.f.close()
+
+            def read(self, size: int) -> bytes:
+                if self.f.tell():
+                    raise ProcessLookupError(3, "No such process")
+                return self.f.read(size)
+
+        def fake_open(path, *args, **kwargs):
+            f = real_open(path, *args, **kwargs)
+            return Vanishing(f) if str(path).endswith("smaps") else f
+
+        monkeypatch.setattr("builtins.open", fake_open)
+        with pytest.raises(ValueError, match="exited while being inspected"):
+            inspect_process_memory(fake_proc)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 300])
+    def test_mappings_split_across_chunks(
+        self, fake_proc, monkeypatch, chunk_size
+    ) -> None:
+        whole = inspect_process_memory(fake_proc, n=100)
+        monkeypatch.setattr(smaps, "CHUNK_SIZE", chunk_size)
+        assert inspect_process_memory(fake_proc, n=100) == whole
+
+    def test_many_mappings(self, tmp_path, monkeypatch) -> None:
+        pid_dir = tmp_path / "4242"
+        pid_dir.mkdir()
+        (pid_dir / "smaps").write_text(
+            "".join(
+                self._mapping(f"{i:08x}-{i + 1:08x} rw-p 00000000 00:00 0", i % 8)
+                for i in range(100_000)
+            )
+        )
+        monkeypatch.setattr(smaps, "PROC_ROOT", str(tmp_path))
+        result = inspect_process_memory(4242, n=3)
+        assert result.mapping_count == 100_000
+        assert result.rss_mb == round(sum(i % 8 for i in range(100_000)) / 1024, 2)
+        assert [m.rss_mb for m in result.top_mappings] == [round(7 / 1024, 2)] * 3
+
+    def test_totals(self, fake_proc) -> None:
+        result = inspect_process_memory(fake_proc)
+        assert result.name == "java"
+        assert result.mapping_count == 9
+        assert result.rss_mb == round(19524 / 1024, 2)
+        assert result.swap_mb == 0.5
+
+    def test_categories(self, fake_proc) -> None:
+        result = inspect_process_memory(fake_proc)
+        by_key = {g.key: g for g in result.categories}
+        assert by_key["anon"].count == 2
+        assert by_key["anon"].rss_mb == 12.0
+        assert by_key["heap"].rss_mb == 2.0
+        assert by_key["shmem"].rss_mb == 3.0
+        assert by_key["file"].count == 3
+        assert by_key["stack"].count == 1
+        assert by_key["special"].count == 1
+        assert result.categories[0].key == "anon"
+
+    def test_top_paths_aggregate_mappings(self, fake_proc) -> None:
+        result = inspect_process_memory(fake_proc, n=10)
+        by_key = {g.key: g for g in result.top_paths}
+        assert by_key["/usr/lib/libjvm.so"].count == 2
+        assert by_key["/usr/lib/libjvm.so"].rss_mb == 1.0
+        assert by_key["[anon]"].category == "anon"
+
+    def test_top_mappings_bounded_and_sorted(self, fake_proc) -> None:
+        result = inspect_process_memory(fake_proc, n=3)
+        assert len(result.top_mappings) == 3
+        assert [m.rss_mb for m in result.top_mappings] == [8.0, 4.0, 3.0]
+        assert result.top_mappings[0].address == "7f000000-7f100000"
+        assert result.top_mappings[0].path == ""
+        assert result.top_mappings[2].path == "/dev/shm/buf"
+
+    def test_sort_by_swap(self, fake_proc) -> None:
+        result = inspect_process_memory(fake_proc, n=1, sort_by="swap")
+        assert result.top_mappings[0].swap_mb == 0.5
+
+
 class TestKillProcesses:
     """Tests for kill_processes."""
 